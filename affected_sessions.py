@@ -8,32 +8,283 @@ This enables incremental processing instead of recalculating all sessions.
 Key Functions:
 - find_affected_sessions(): Main entry point to find all affected sessions
 - detect_new_session_periods(): Check if new sessions can be created
+- session_exists(): Indexed existence probe for a single session period
 - mark_sessions_for_recalc(): Mark sessions that need recalculation
+- clear_recalc_flags(): Clear the recalc flag for a batch of sessions
+- bulk_update(): Apply per-session recalc flag updates in one transaction
+- invalidate_affected_sessions_cache(): Reset cached lookups after external writes
+- configure_connection(): Apply performance PRAGMAs to a new connection
+
+Write helpers run inside the caller's transaction (bulk_update() opens its
+own when none is active). Batch IDs and commit once per batch rather than
+once per session.
 """
 
+import json
 import sqlite3
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
-import pytz
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple, Optional, Union
+from zoneinfo import ZoneInfo
 
 DB_PATH = 'data/yearly_monthly.db'
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('US/Eastern')
+
+
+# ============================================================================
+# Queries (module-level so the SQL text, and the statement cache key, is stable)
+# ============================================================================
+# Run through conn.execute(), which goes through the connection's statement
+# cache; open connections with cached_statements=STATEMENT_CACHE_SIZE.
+
+STATEMENT_CACHE_SIZE = 256
+
+QUERY_AFFECTED = """
+    -- PoC window overlaps new data
+    SELECT id, symbol, session_type, session_name,
+           period_year, period_month,
+           session_start_time, to_time, true_open, poc, rpp, status,
+           'recalc' AS bucket, session_start_time AS sort_key
+    FROM sessions
+    WHERE symbol = ?
+    AND true_open IS NOT NULL
+    AND session_start_time <= ?
+    AND to_time >= ?
+
+    UNION ALL
+
+    -- Session doesn't have TO yet (incomplete)
+    SELECT id, symbol, session_type, session_name,
+           period_year, period_month,
+           session_start_time, to_time, true_open, poc, rpp, status,
+           'recalc' AS bucket, session_start_time AS sort_key
+    FROM sessions
+    WHERE symbol = ?
+    AND true_open IS NULL
+
+    UNION ALL
+
+    -- Active sessions that need a POI rescan
+    SELECT id, symbol, session_type, session_name,
+           period_year, period_month,
+           NULL, to_time, NULL, poc, rpp, status,
+           'scan' AS bucket, to_time AS sort_key
+    FROM sessions
+    WHERE symbol = ?
+    AND status IN ('unbroken', 'break', 'return')
+    AND to_time < ?
+
+    ORDER BY bucket, sort_key, id
+"""
+
+QUERY_YEAR_HAS_DATA = """
+    SELECT 1 FROM ohlc_4h
+    WHERE symbol = ?
+    AND time >= ?
+    AND time <= ?
+    LIMIT 1
+"""
+
+QUERY_MONTHS_WITH_DATA = """
+    WITH RECURSIVE bounds(start_ym, end_ym) AS (
+        SELECT ?, ?
+    ),
+    months(ym, month_start, next_start) AS (
+        SELECT start_ym,
+               printf('%04d-%02d-01T00:00:00-05:00', start_ym / 12, start_ym % 12 + 1),
+               printf('%04d-%02d-01T00:00:00-05:00', (start_ym + 1) / 12, (start_ym + 1) % 12 + 1)
+        FROM bounds
+        WHERE start_ym <= end_ym
+        UNION ALL
+        SELECT ym + 1,
+               next_start,
+               printf('%04d-%02d-01T00:00:00-05:00', (ym + 2) / 12, (ym + 2) % 12 + 1)
+        FROM months, bounds
+        WHERE ym < end_ym
+    )
+    SELECT ym / 12, ym % 12 + 1
+    FROM months
+    WHERE (
+        SELECT COUNT(*) FROM ohlc_4h
+        WHERE symbol = ?
+        AND time >= month_start
+        AND time < next_start
+    ) >= 50
+    ORDER BY ym
+"""
+
+QUERY_SESSION_EXISTS = """
+    SELECT 1 FROM sessions
+    WHERE symbol = ? AND session_type = ?
+    AND period_year = ? AND period_month IS ?
+    LIMIT 1
+"""
+
+QUERY_NEEDING_RECALC_SYMBOL = """
+    SELECT id, symbol, session_type, session_name, period_year, period_month,
+           session_start_time, to_time, true_open, poc, rpp, status
+    FROM sessions
+    WHERE needs_recalc = 1
+    AND symbol = ?
+    ORDER BY session_start_time
+"""
+
+QUERY_NEEDING_RECALC_ALL = """
+    SELECT id, symbol, session_type, session_name, period_year, period_month,
+           session_start_time, to_time, true_open, poc, rpp, status
+    FROM sessions
+    WHERE needs_recalc = 1
+    ORDER BY session_start_time
+"""
+
+UPDATE_MARK_RECALC = """
+    UPDATE sessions
+    SET needs_recalc = 1,
+        updated_at = ?
+    WHERE id IN (SELECT value FROM json_each(?))
+"""
+
+UPDATE_CLEAR_RECALC = """
+    UPDATE sessions
+    SET needs_recalc = 0,
+        last_recalc_time = ?,
+        updated_at = ?
+    WHERE id IN (SELECT value FROM json_each(?))
+"""
+
+UPDATE_RECALC_FLAGS = """
+    UPDATE sessions
+    SET needs_recalc = ?,
+        last_recalc_time = ?,
+        updated_at = ?
+    WHERE id = ?
+"""
+
+
+class SessionRow(NamedTuple):
+    """A session as returned by find_affected_sessions()/get_sessions_needing_recalc()."""
+    id: int
+    symbol: str
+    session_type: str
+    session_name: str
+    period_year: Optional[int]
+    period_month: Optional[int]
+    session_start_time: Optional[str]  # NULL for 'scan' results
+    to_time: str
+    true_open: Optional[float]  # NULL for 'scan' results
+    poc: Optional[float]
+    rpp: Optional[float]
+    status: str
+
+
+SESSION_ROW_LEN = len(SessionRow._fields)
+_make_session_row = SessionRow._make
+
+# In-process cache of session existence probes used by
+# detect_new_session_periods(), keyed by (symbol, session_type).
+# Each entry is (sessions_version, {(year, month): exists}); entries from an
+# older version are discarded. Write functions in this module bump the
+# version; other writers must call invalidate_affected_sessions_cache().
+_existing_periods_cache: Dict[Tuple[str, str], Tuple[int, Dict[Tuple[int, Optional[int]], bool]]] = {}
+_sessions_version = 0
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """
+    Apply connection PRAGMAs tuned for the read-heavy session workload.
+
+    - journal_mode=WAL: readers don't block the writer (and vice versa)
+    - synchronous=NORMAL: fsync at checkpoints only; durable enough for
+      derived data like sessions, which can always be recalculated from OHLC
+    - temp_store=MEMORY: sorts/temp B-trees stay in RAM
+    - mmap_size=256MB: reads come straight from the page cache mapping
+    - cache_size=-65536: 64MB page cache keeps sessions hot
+
+    Call once per connection, right after sqlite3.connect().
+
+    Returns:
+        The same connection, for chaining
+    """
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA cache_size = -65536")
+    return conn
+
+
+def _now_et_iso() -> str:
+    """Current Eastern time as an ISO string (for updated_at/last_recalc_time)."""
+    return datetime.now(ET).isoformat()
+
+
+@lru_cache(maxsize=128)
+def _parse_iso(value: str) -> datetime:
+    """Memoized datetime.fromisoformat() for repeated range bounds."""
+    return datetime.fromisoformat(value)
+
+
+def _to_dt(value: Union[str, datetime]) -> datetime:
+    """Accept an ISO string or a datetime and return a datetime."""
+    return value if isinstance(value, datetime) else _parse_iso(value)
+
+
+def _to_iso(value: Union[str, datetime]) -> str:
+    """Accept an ISO string or a datetime and return the ISO string for SQL."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _month_ordinal(dt: datetime) -> int:
+    """Month count since year 0 (year * 12 + month - 1); divmod(n, 12) undoes it."""
+    return dt.year * 12 + dt.month - 1
+
+
+def invalidate_affected_sessions_cache() -> None:
+    """Discard cached session existence results after writing to sessions."""
+    global _sessions_version
+    _sessions_version += 1
+    _existing_periods_cache.clear()
+
+
+def _period_exists(
+    conn: sqlite3.Connection,
+    symbol: str,
+    session_type: str,
+    year: int,
+    month: Optional[int] = None
+) -> bool:
+    """Cached session_exists() for repeated detect_new_session_periods() calls."""
+    key = (symbol, session_type)
+    entry = _existing_periods_cache.get(key)
+    if entry is None or entry[0] != _sessions_version:
+        entry = (_sessions_version, {})
+        _existing_periods_cache[key] = entry
+
+    known = entry[1]
+    period = (year, month)
+    if period not in known:
+        known[period] = session_exists(conn, symbol, session_type, year, month)
+    return known[period]
 
 
 def find_affected_sessions(
     conn: sqlite3.Connection,
     symbol: str,
-    new_data_start_time: str,
-    new_data_end_time: str
-) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    new_data_start_time: Union[str, datetime],
+    new_data_end_time: Union[str, datetime]
+) -> Tuple[List['SessionRow'], List['SessionRow'], List[Dict]]:
     """
     Find all sessions affected by new data range.
 
+    Sessions are returned as SessionRow named tuples (session.poc);
+    use session._asdict() where a real dict is needed.
+
     Args:
         conn: Database connection
         symbol: Symbol name (e.g., 'ES', 'NQ')
-        new_data_start_time: Start of new data (ISO format)
-        new_data_end_time: End of new data (ISO format)
+        new_data_start_time: Start of new data (ISO string or datetime)
+        new_data_end_time: End of new data (ISO string or datetime)
 
     Returns:
         Tuple of:
@@ -41,82 +292,52 @@ def find_affected_sessions(
         - sessions_to_scan: Sessions needing POI rescanning (future phase)
         - new_sessions_possible: New session periods that can be created
     """
-    cursor = conn.cursor()
+    # SQL compares ISO strings; datetimes are converted only here
+    start_iso = _to_iso(new_data_start_time)
+    end_iso = _to_iso(new_data_end_time)
 
     # ========================================================================
-    # 1. Sessions with PoC windows overlapping new data
+    # 1. Sessions with PoC windows overlapping new data ('recalc' bucket)
     # ========================================================================
     # These sessions might have their PoC/TO/RPP values change
     # We need to check:
     # - Yearly sessions: If new data falls in Q1 (January-March) of that year
     # - Monthly sessions: If new data falls in first week of that month
     # - Sessions without TO yet (incomplete sessions)
-
-    sessions_to_recalc = []
-
+    #
     # Find sessions where:
     # - Session start time <= new_data_end AND
     # - TO time >= new_data_start (their window overlaps)
     # OR
     # - true_open IS NULL (incomplete session, still being calculated)
-    cursor.execute("""
-        SELECT id, symbol, session_type, session_name, session_start_time, to_time,
-               true_open, poc, rpp, status
-        FROM sessions
-        WHERE symbol = ?
-        AND (
-            -- PoC window overlaps new data
-            (session_start_time <= ? AND to_time >= ?)
-
-            -- OR session doesn't have TO yet (incomplete)
-            OR (true_open IS NULL)
-        )
-        ORDER BY session_start_time
-    """, (symbol, new_data_end_time, new_data_start_time))
-
-    for row in cursor.fetchall():
-        sessions_to_recalc.append({
-            'id': row[0],
-            'symbol': row[1],
-            'session_type': row[2],
-            'session_name': row[3],
-            'session_start_time': row[4],
-            'to_time': row[5],
-            'true_open': row[6],
-            'poc': row[7],
-            'rpp': row[8],
-            'status': row[9]
-        })
 
     # ========================================================================
-    # 2. Active sessions that might see new POI touches (for Phase 3)
+    # 2. Active sessions that might see new POI touches ('scan' bucket)
     # ========================================================================
     # These sessions don't need PoC/TO/RPP recalc, but need POI event rescanning
     # Status 'unbroken', 'break', or 'return' means they're actively tracking
     # We'll implement this in Phase 3 (POI processing)
 
+    # Both sets come back from one UNION ALL round-trip, tagged by bucket.
+    # sort_key keeps each bucket in its original order (start time / TO time).
+    # The overlap/incomplete OR is split into two disjoint branches: an OR
+    # mixing a range with an IS NULL test makes SQLite fall back to a table
+    # scan, while each branch here can use its own (partial) index.
+    cursor = conn.execute(QUERY_AFFECTED, (symbol, end_iso, start_iso,
+                                           symbol,
+                                           symbol, end_iso))
+
+    # The leading columns map straight onto SessionRow; bucket and sort_key
+    # trail so they can be sliced off.
+    sessions_to_recalc = []
     sessions_to_scan = []
 
-    cursor.execute("""
-        SELECT id, symbol, session_type, session_name, to_time, poc, rpp, status
-        FROM sessions
-        WHERE symbol = ?
-        AND status IN ('unbroken', 'break', 'return')
-        AND to_time < ?
-        ORDER BY to_time
-    """, (symbol, new_data_end_time))
-
-    for row in cursor.fetchall():
-        sessions_to_scan.append({
-            'id': row[0],
-            'symbol': row[1],
-            'session_type': row[2],
-            'session_name': row[3],
-            'to_time': row[4],
-            'poc': row[5],
-            'rpp': row[6],
-            'status': row[7]
-        })
+    for row in cursor:
+        session = _make_session_row(row[:SESSION_ROW_LEN])
+        if row[SESSION_ROW_LEN] == 'recalc':
+            sessions_to_recalc.append(session)
+        else:
+            sessions_to_scan.append(session)
 
     # ========================================================================
     # 3. Check if new sessions can be created
@@ -131,8 +352,8 @@ def find_affected_sessions(
 def detect_new_session_periods(
     conn: sqlite3.Connection,
     symbol: str,
-    new_data_start_time: str,
-    new_data_end_time: str
+    new_data_start_time: Union[str, datetime],
+    new_data_end_time: Union[str, datetime]
 ) -> List[Dict]:
     """
     Detect new session periods that can now be created with new data.
@@ -144,18 +365,17 @@ def detect_new_session_periods(
     Args:
         conn: Database connection
         symbol: Symbol name
-        new_data_start_time: Start of new data (ISO format)
-        new_data_end_time: End of new data (ISO format)
+        new_data_start_time: Start of new data (ISO string or datetime)
+        new_data_end_time: End of new data (ISO string or datetime)
 
     Returns:
         List of dictionaries describing new session periods
     """
-    cursor = conn.cursor()
     new_periods = []
 
-    # Parse dates
-    new_start = datetime.fromisoformat(new_data_start_time)
-    new_end = datetime.fromisoformat(new_data_end_time)
+    # Parse dates (no-op for datetimes, memoized for repeated ISO strings)
+    new_start = _to_dt(new_data_start_time)
+    new_end = _to_dt(new_data_end_time)
 
     # ========================================================================
     # Check for new YEARLY sessions
@@ -163,34 +383,20 @@ def detect_new_session_periods(
     # A Yearly session can be created if we have data through at least April
     # (since TO is first Monday of April)
 
-    # Get existing Yearly sessions for this symbol
-    cursor.execute("""
-        SELECT session_name FROM sessions
-        WHERE symbol = ? AND session_type = 'Yearly'
-    """, (symbol,))
-
-    existing_years = set()
-    for row in cursor.fetchall():
-        # Session name is like "Year 2019"
-        year_str = row[0].replace('Year ', '')
-        existing_years.add(int(year_str))
-
     # Check if new data allows creating new Yearly sessions
     # We need data through at least April to calculate a Yearly session
     if new_end.month >= 4:  # Have data into April or later
         year = new_end.year
-        if year not in existing_years:
+        if not _period_exists(conn, symbol, 'Yearly', year):
             # Check if we have enough data for this year
             # Need data from January 1st through at least first week of April
-            cursor.execute("""
-                SELECT COUNT(*) FROM ohlc_4h
-                WHERE symbol = ?
-                AND time >= ?
-                AND time <= ?
-            """, (symbol, f"{year}-01-01T00:00:00-05:00", f"{year}-04-07T23:59:59-04:00"))
-
-            count = cursor.fetchone()[0]
-            if count > 0:
+            # Only existence matters, so stop at the first matching candle
+            row = conn.execute(
+                QUERY_YEAR_HAS_DATA,
+                (symbol, f"{year}-01-01T00:00:00-05:00", f"{year}-04-07T23:59:59-04:00")
+            ).fetchone()
+
+            if row is not None:
                 new_periods.append({
                     'type': 'Yearly',
                     'year': year,
@@ -203,68 +409,60 @@ def detect_new_session_periods(
     # A Monthly session can be created if we have data through at least
     # the second full week of the month (for TO calculation)
 
-    # Get existing Monthly sessions for this symbol
-    cursor.execute("""
-        SELECT session_name FROM sessions
-        WHERE symbol = ? AND session_type = 'Monthly'
-    """, (symbol,))
-
-    existing_months = set()
-    for row in cursor.fetchall():
-        # Session name is like "January 2019"
-        session_name = row[0]
-        # Parse month and year
-        parts = session_name.split()
-        if len(parts) == 2:
-            month_name, year_str = parts
-            month_num = datetime.strptime(month_name, '%B').month
-            year = int(year_str)
-            existing_months.add((year, month_num))
-
-    # Check each month in the new data range
-    current_month = new_start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    end_month = new_end.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-    while current_month <= end_month:
-        year = current_month.year
-        month = current_month.month
-
-        if (year, month) not in existing_months:
-            # Check if we have enough data for this month
-            # Need at least 2 weeks of data
-            month_start = f"{year}-{month:02d}-01T00:00:00-05:00"
-            if month == 12:
-                next_month_start = f"{year + 1}-01-01T00:00:00-05:00"
-            else:
-                next_month_start = f"{year}-{month + 1:02d}-01T00:00:00-05:00"
-
-            cursor.execute("""
-                SELECT COUNT(*) FROM ohlc_4h
-                WHERE symbol = ?
-                AND time >= ?
-                AND time < ?
-            """, (symbol, month_start, next_month_start))
-
-            count = cursor.fetchone()[0]
-            # Roughly 2 weeks of 4H data = 2 * 7 * 6 = 84 candles
-            # Use 50 as a conservative threshold
-            if count >= 50:
-                new_periods.append({
-                    'type': 'Monthly',
-                    'year': year,
-                    'month': month,
-                    'symbol': symbol
-                })
-
-        # Move to next month
-        if current_month.month == 12:
-            current_month = current_month.replace(year=current_month.year + 1, month=1)
-        else:
-            current_month = current_month.replace(month=current_month.month + 1)
+    # Enumerate the months in the new data range and count each month's
+    # candles in one recursive CTE, keeping only months with enough data.
+    # Months are walked as a single ordinal (year * 12 + month - 1); each
+    # step reuses the previous month's end boundary as its start, so only
+    # one boundary string is formatted per month.
+    # Roughly 2 weeks of 4H data = 2 * 7 * 6 = 84 candles
+    # Use 50 as a conservative threshold
+    months_with_data = conn.execute(
+        QUERY_MONTHS_WITH_DATA,
+        (_month_ordinal(new_start), _month_ordinal(new_end), symbol)
+    ).fetchall()
+
+    for year, month in months_with_data:
+        # Need at least 2 weeks of data (checked above) and no session yet
+        if not _period_exists(conn, symbol, 'Monthly', year, month):
+            new_periods.append({
+                'type': 'Monthly',
+                'year': year,
+                'month': month,
+                'symbol': symbol
+            })
 
     return new_periods
 
 
+def session_exists(
+    conn: sqlite3.Connection,
+    symbol: str,
+    session_type: str,
+    year: int,
+    month: Optional[int] = None
+) -> bool:
+    """
+    Check whether a session already exists for a period.
+
+    Probes idx_sessions_period with integer equality on period_year /
+    period_month, so only the candidate period is looked up instead of
+    loading every session name for the symbol.
+
+    Args:
+        conn: Database connection
+        symbol: Symbol name
+        session_type: 'Yearly' or 'Monthly'
+        year: Period year
+        month: Period month (1-12) for Monthly sessions, None for Yearly
+
+    Returns:
+        True if a matching session row exists
+    """
+    row = conn.execute(QUERY_SESSION_EXISTS, (symbol, session_type, year, month)).fetchone()
+
+    return row is not None
+
+
 def mark_sessions_for_recalc(
     conn: sqlite3.Connection,
     session_ids: List[int]
@@ -272,7 +470,8 @@ def mark_sessions_for_recalc(
     """
     Mark sessions as needing recalculation.
 
-    Sets needs_recalc = 1 for specified sessions.
+    Sets needs_recalc = 1 for specified sessions. Runs in the caller's
+    transaction; the caller commits.
 
     Args:
         conn: Database connection
@@ -284,47 +483,89 @@ def mark_sessions_for_recalc(
     if not session_ids:
         return 0
 
-    cursor = conn.cursor()
-    now = datetime.now(ET).isoformat()
+    now = _now_et_iso()
 
-    placeholders = ','.join('?' * len(session_ids))
-    cursor.execute(f"""
-        UPDATE sessions
-        SET needs_recalc = 1,
-            updated_at = ?
-        WHERE id IN ({placeholders})
-    """, [now] + session_ids)
+    invalidate_affected_sessions_cache()
+
+    # IDs are passed as one JSON array so the SQL text is constant
+    # (statement-cache hit) and not bound by SQLITE_MAX_VARIABLE_NUMBER
+    cursor = conn.execute(UPDATE_MARK_RECALC, (now, json.dumps(list(session_ids))))
 
     return cursor.rowcount
 
 
-def clear_recalc_flag(
+def bulk_update(
     conn: sqlite3.Connection,
-    session_id: int
-) -> None:
+    updates: List[Tuple[int, Optional[str], str, int]]
+) -> int:
     """
-    Clear the needs_recalc flag and update last_recalc_time for a session.
+    Apply many per-session recalc flag updates in one transaction.
+
+    Opens BEGIN IMMEDIATE when no transaction is active and commits at the
+    end, so a whole batch pays for one commit instead of one per session.
+    If the caller already has a transaction open, the updates join it and
+    committing is left to the caller.
 
     Args:
         conn: Database connection
-        session_id: Session ID to clear
+        updates: (needs_recalc, last_recalc_time, updated_at, session_id) tuples
+
+    Returns:
+        Number of sessions updated
     """
-    cursor = conn.cursor()
-    now = datetime.now(ET).isoformat()
+    if not updates:
+        return 0
 
-    cursor.execute("""
-        UPDATE sessions
-        SET needs_recalc = 0,
-            last_recalc_time = ?,
-            updated_at = ?
-        WHERE id = ?
-    """, (now, now, session_id))
+    own_transaction = not conn.in_transaction
+    if own_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+
+    try:
+        cursor = conn.executemany(UPDATE_RECALC_FLAGS, updates)
+        invalidate_affected_sessions_cache()
+        if own_transaction:
+            conn.commit()
+    except Exception:
+        if own_transaction:
+            conn.rollback()
+        raise
+
+    return cursor.rowcount
+
+
+def clear_recalc_flags(
+    conn: sqlite3.Connection,
+    session_ids: List[int]
+) -> int:
+    """
+    Clear the needs_recalc flag for many sessions in one pass.
+
+    The timestamp is computed once and a single UPDATE covers every ID.
+    Runs in the caller's transaction; batch IDs rather than calling this
+    per session.
+
+    Args:
+        conn: Database connection
+        session_ids: Session IDs to clear
+
+    Returns:
+        Number of sessions cleared
+    """
+    if not session_ids:
+        return 0
+
+    now = _now_et_iso()
+    invalidate_affected_sessions_cache()
+
+    cursor = conn.execute(UPDATE_CLEAR_RECALC, (now, now, json.dumps(list(session_ids))))
+
+    return cursor.rowcount
 
 
 def get_sessions_needing_recalc(
     conn: sqlite3.Connection,
     symbol: str = None
-) -> List[Dict]:
+) -> List['SessionRow']:
     """
     Get all sessions that have needs_recalc = 1.
 
@@ -333,61 +574,97 @@ def get_sessions_needing_recalc(
         symbol: Optional symbol filter
 
     Returns:
-        List of session dictionaries
+        List of SessionRow named tuples
     """
-    cursor = conn.cursor()
-
     if symbol:
-        query = """
-            SELECT id, symbol, session_type, session_name, session_start_time, to_time,
-                   true_open, poc, rpp, status
-            FROM sessions
-            WHERE needs_recalc = 1
-            AND symbol = ?
-            ORDER BY session_start_time
-        """
-        cursor.execute(query, (symbol,))
+        cursor = conn.execute(QUERY_NEEDING_RECALC_SYMBOL, (symbol,))
     else:
-        query = """
-            SELECT id, symbol, session_type, session_name, session_start_time, to_time,
-                   true_open, poc, rpp, status
-            FROM sessions
-            WHERE needs_recalc = 1
-            ORDER BY session_start_time
-        """
-        cursor.execute(query)
-
-    sessions = []
-    for row in cursor.fetchall():
-        sessions.append({
-            'id': row[0],
-            'symbol': row[1],
-            'session_type': row[2],
-            'session_name': row[3],
-            'session_start_time': row[4],
-            'to_time': row[5],
-            'true_open': row[6],
-            'poc': row[7],
-            'rpp': row[8],
-            'status': row[9]
-        })
-
-    return sessions
+        cursor = conn.execute(QUERY_NEEDING_RECALC_ALL)
+
+    return list(map(_make_session_row, cursor))
+
+
+def _explain(conn: sqlite3.Connection, sql: str, params: Tuple) -> List[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines for a query."""
+    return [row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params)]
+
+
+def _is_table_scan(detail: str) -> bool:
+    """True for a full scan of sessions/ohlc_4h that doesn't go through an index."""
+    return detail.startswith(('SCAN sessions', 'SCAN ohlc_4h')) and 'INDEX' not in detail
+
+
+def _check_plans(conn: sqlite3.Connection, symbol: str, start_iso: str, end_iso: str,
+                 iterations: int = 100) -> bool:
+    """
+    Check that every module query uses an index, and time each one.
+
+    Each query's plan is printed; any bare 'SCAN sessions' / 'SCAN ohlc_4h'
+    fails the check. Timings are taken over `iterations` runs with
+    PRAGMA shrink_memory between runs so the page cache starts cold(er).
+
+    Returns:
+        True if no query plan contains a table scan
+    """
+    start = _to_dt(start_iso)
+    end = _to_dt(end_iso)
+    checks = [
+        ('QUERY_AFFECTED', QUERY_AFFECTED,
+         (symbol, end_iso, start_iso, symbol, symbol, end_iso)),
+        ('QUERY_YEAR_HAS_DATA', QUERY_YEAR_HAS_DATA,
+         (symbol, f"{end.year}-01-01T00:00:00-05:00", f"{end.year}-04-07T23:59:59-04:00")),
+        ('QUERY_MONTHS_WITH_DATA', QUERY_MONTHS_WITH_DATA,
+         (_month_ordinal(start), _month_ordinal(end), symbol)),
+        ('QUERY_SESSION_EXISTS', QUERY_SESSION_EXISTS,
+         (symbol, 'Monthly', end.year, end.month)),
+        ('QUERY_NEEDING_RECALC_SYMBOL', QUERY_NEEDING_RECALC_SYMBOL, (symbol,)),
+        ('QUERY_NEEDING_RECALC_ALL', QUERY_NEEDING_RECALC_ALL, ()),
+    ]
+
+    all_ok = True
+    for name, sql, params in checks:
+        plan = _explain(conn, sql, params)
+        scans = [detail for detail in plan if _is_table_scan(detail)]
+
+        timings = []
+        for _ in range(iterations):
+            conn.execute("PRAGMA shrink_memory")
+            t0 = time.perf_counter_ns()
+            conn.execute(sql, params).fetchall()
+            timings.append(time.perf_counter_ns() - t0)
+        timings.sort()
+
+        status = "FAIL" if scans else "OK"
+        print(f"[{status}] {name}: median {timings[len(timings) // 2] / 1000:.1f}us, "
+              f"max {timings[-1] / 1000:.1f}us over {iterations} runs")
+        for detail in plan:
+            print(f"    {detail}")
+        if scans:
+            all_ok = False
+
+    return all_ok
 
 
 if __name__ == '__main__':
     # Test the affected sessions detection
+    import argparse
     import sys
 
+    parser = argparse.ArgumentParser(description='Test affected session detection')
+    parser.add_argument('--check-plans', action='store_true',
+                        help='Check query plans use indexes and time each query')
+    parser.add_argument('--iterations', type=int, default=100,
+                        help='Timing iterations per query for --check-plans (default: 100)')
+    args = parser.parse_args()
+
     print("Testing Affected Sessions Detection")
     print("=" * 80)
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = configure_connection(sqlite3.connect(DB_PATH, cached_statements=STATEMENT_CACHE_SIZE))
+    plans_ok = True
 
     # Simulate new data from last week
-    cursor = conn.cursor()
-    cursor.execute("SELECT MAX(time) FROM ohlc_4h WHERE symbol = 'ES'")
-    max_time = cursor.fetchone()[0]
+    max_time = conn.execute("SELECT MAX(time) FROM ohlc_4h WHERE symbol = 'ES'").fetchone()[0]
 
     if max_time:
         print(f"Latest data time: {max_time}")
@@ -404,19 +681,19 @@ if __name__ == '__main__':
 
         # Find affected sessions
         sessions_to_recalc, sessions_to_scan, new_periods = find_affected_sessions(
-            conn, 'ES', new_start.isoformat(), new_end.isoformat()
+            conn, 'ES', new_start, new_end
         )
 
         print(f"Sessions needing recalculation: {len(sessions_to_recalc)}")
         for session in sessions_to_recalc[:5]:  # Show first 5
-            print(f"  - {session['session_name']} ({session['session_type']})")
+            print(f"  - {session.session_name} ({session.session_type})")
         if len(sessions_to_recalc) > 5:
             print(f"  ... and {len(sessions_to_recalc) - 5} more")
 
         print()
         print(f"Sessions needing POI scan: {len(sessions_to_scan)}")
         for session in sessions_to_scan[:5]:
-            print(f"  - {session['session_name']} ({session['session_type']}, status={session['status']})")
+            print(f"  - {session.session_name} ({session.session_type}, status={session.status})")
         if len(sessions_to_scan) > 5:
             print(f"  ... and {len(sessions_to_scan) - 5} more")
 
@@ -428,9 +705,20 @@ if __name__ == '__main__':
             else:
                 print(f"  - Monthly {period['year']}-{period['month']:02d}")
 
+        if args.check_plans:
+            print()
+            print("Query plans")
+            print("-" * 80)
+            plans_ok = _check_plans(conn, 'ES', new_start.isoformat(), new_end.isoformat(),
+                                    args.iterations)
+
     else:
         print("No data found in database")
 
     conn.close()
     print()
     print("=" * 80)
+
+    if not plans_ok:
+        print("[ERROR] Table scan found in a query plan")
+        sys.exit(1)
@@ -11,22 +11,30 @@ This script populates the sessions table with:
 
 All session calculations follow the specs in docs/reference/session-tables.md
 
+Candle lookups range over ohlc_1m.time_ns (run migrate_add_ohlc_time_ns_1m.py
+on existing databases).
+
 Supports incremental processing - only calculates new/affected sessions.
 
 Usage:
-    # Incremental mode (default)
-    python calculate_daily_sessions.py
-
-    # Full mode (recalculate all)
+    # Full mode (recalculate all; the default for now)
     python calculate_daily_sessions.py --full
 
+    # Incremental mode (resume from the last session_calc watermark)
+    python calculate_daily_sessions.py --incremental
+
     # Specific symbol
     python calculate_daily_sessions.py --symbol ES
 """
 
 import sqlite3
 import argparse
-from datetime import datetime, timedelta, time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timedelta, time
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import pytz
 from metadata_helpers_1m import (
@@ -38,6 +46,9 @@ from metadata_helpers_1m import (
 DB_PATH = 'data/ohlc_data.db'
 ET = pytz.timezone('US/Eastern')
 
+# Prepared statements kept per connection (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
 # Major session definitions (times in ET)
 # Per docs/reference/session-tables.md
 MAJOR_SESSIONS = {
@@ -96,37 +107,80 @@ MINOR_SESSIONS = [
 ]
 
 
-def get_db_connection():
-    """Create database connection with foreign keys enabled."""
-    conn = sqlite3.connect(DB_PATH)
+def get_db_connection(readonly: bool = False):
+    """
+    Create database connection with foreign keys enabled.
+
+    The PRAGMAs suit this bulk workload: WAL with synchronous=NORMAL defers
+    fsyncs to checkpoints (sessions can always be rebuilt from OHLC), and the
+    256MB page cache plus 1GB mmap keep the ohlc_1m B-tree resident.
+
+    Args:
+        readonly: Set query_only so the connection cannot write
+    """
+    conn = sqlite3.connect(DB_PATH, cached_statements=STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
     conn.execute('PRAGMA foreign_keys = ON')
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = NORMAL')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    conn.execute('PRAGMA cache_size = -262144')
+    conn.execute('PRAGMA mmap_size = 1073741824')
+    if readonly:
+        conn.execute('PRAGMA query_only = ON')
     return conn
 
 
+def to_ns(dt: datetime) -> int:
+    """Epoch nanoseconds of an aware datetime (matches ohlc_1m.time_ns)."""
+    return int(dt.timestamp()) * 1_000_000_000
+
+
+@lru_cache(maxsize=1024)
+def _et_day_tzinfo(day: date):
+    """The pytz tzinfo in force for the whole day, or None on a DST change day."""
+    day_start = ET.localize(datetime.combine(day, time(0, 0)))
+    next_start = ET.localize(datetime.combine(day + timedelta(days=1), time(0, 0)))
+    if day_start.utcoffset() != next_start.utcoffset():
+        return None
+    return day_start.tzinfo
+
+
+@lru_cache(maxsize=4096)
+def et_dt(day: date, at: time) -> datetime:
+    """
+    ET-localized datetime for a date and wall-clock time.
+
+    Session boundaries repeat the same (day, time) pairs across sessions
+    (e.g. the 16:59 previous close), so the pytz transition lookup is cached.
+    On days without a DST change every time shares one offset, so the
+    21+ session boundaries of a day attach that tzinfo directly and only
+    transition days pay for ET.localize.
+    Stays on pytz rather than zoneinfo: timedelta arithmetic on these values
+    keeps the fixed offset, which expires_at and the window ends rely on.
+    """
+    tzinfo = _et_day_tzinfo(day)
+    if tzinfo is None:
+        return ET.localize(datetime.combine(day, at))
+    return datetime.combine(day, at, tzinfo=tzinfo)
+
+
 def calculate_poc_and_rpp(
-    candles: List[Tuple],
+    highest: float,
+    lowest: float,
     to_price: float
 ) -> Tuple[float, float]:
     """
-    Calculate PoC and RPP from candles and TO price.
+    Calculate PoC and RPP from the PoC window's extremes and TO price.
 
     PoC = highest high or lowest low with greatest variance from TO
+    (ties go to the low side)
     RPP = 2 * TO - PoC (mirror projection)
-    """
-    if not candles:
-        return None, None
-
-    highest = max(candle[2] for candle in candles)  # high
-    lowest = min(candle[3] for candle in candles)   # low
-
-    high_variance = abs(highest - to_price)
-    low_variance = abs(lowest - to_price)
 
-    poc = highest if high_variance > low_variance else lowest
-    rpp = 2 * to_price - poc
-
-    return poc, rpp
+    The extremes come from get_window_extremes.
+    """
+    poc = highest if abs(highest - to_price) > abs(lowest - to_price) else lowest
+    return poc, 2 * to_price - poc
 
 
 def has_complete_data(
@@ -134,7 +188,8 @@ def has_complete_data(
     symbol: str,
     start_time: datetime,
     end_time: datetime,
-    min_coverage_pct: float = 0.95
+    min_coverage_pct: float = 0.95,
+    cache: Optional['SymbolCache'] = None
 ) -> bool:
     """
     Check if we have complete data coverage for a time period.
@@ -145,36 +200,47 @@ def has_complete_data(
         start_time: Period start
         end_time: Period end
         min_coverage_pct: Minimum percentage of expected candles (default 95%)
+        cache: Optional in-memory candles for the symbol; the first candle and
+            the period count then come from bisect instead of two queries
 
     Returns:
         True if we have sufficient data coverage, False otherwise
     """
-    cursor = conn.cursor()
+    start_ns = to_ns(start_time)
+    end_ns = to_ns(end_time)
 
-    # Get first available data point
-    cursor.execute("""
-        SELECT MIN(time) FROM ohlc_1m WHERE symbol = ?
-    """, (symbol,))
+    if cache is not None:
+        first_data_ns = cache.times_ns[0] if cache.times_ns else None
+    else:
+        cursor = conn.cursor()
 
-    first_data = cursor.fetchone()[0]
-    if not first_data:
-        return False
+        # Get first available data point
+        cursor.execute("""
+            SELECT MIN(time_ns) FROM ohlc_1m WHERE symbol = ?
+        """, (symbol,))
 
-    first_data_dt = datetime.fromisoformat(first_data)
+        first_data_ns = cursor.fetchone()[0]
+
+    if first_data_ns is None:
+        return False
 
     # If our data starts after the required start time, we don't have complete coverage
-    if first_data_dt > start_time:
+    if first_data_ns > start_ns:
         return False
 
     # Count actual candles in the period
-    cursor.execute("""
-        SELECT COUNT(*) FROM ohlc_1m
-        WHERE symbol = ?
-        AND time >= ?
-        AND time < ?
-    """, (symbol, start_time.isoformat(), end_time.isoformat()))
+    if cache is not None:
+        lo, hi = cache.window(start_ns, end_ns)
+        actual_count = hi - lo
+    else:
+        cursor.execute("""
+            SELECT COUNT(*) FROM ohlc_1m
+            WHERE symbol = ?
+            AND time_ns >= ?
+            AND time_ns < ?
+        """, (symbol, start_ns, end_ns))
 
-    actual_count = cursor.fetchone()[0]
+        actual_count = cursor.fetchone()[0]
 
     # Calculate expected candles (1 per minute)
     total_minutes = int((end_time - start_time).total_seconds() / 60)
@@ -187,6 +253,45 @@ def has_complete_data(
     return True
 
 
+class SymbolCache:
+    """
+    All of one symbol's 1m candles held column-wise in memory.
+
+    Times are epoch ns in an array('q') (same values as ohlc_1m.time_ns), so
+    bisect over them matches the SQL range queries; prices are array('d').
+    Loaded once per symbol in full mode to take SQL out of the session loops.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, symbol: str):
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT time_ns, open, high, low, close
+            FROM ohlc_1m
+            WHERE symbol = ?
+            ORDER BY time_ns
+        """, (symbol,))
+        rows = cursor.fetchall()
+
+        self.symbol = symbol
+        self.times_ns = array('q', [row[0] for row in rows])
+        self.opens = array('d', [row[1] for row in rows])
+        self.highs = array('d', [row[2] for row in rows])
+        self.lows = array('d', [row[3] for row in rows])
+        self.closes = array('d', [row[4] for row in rows])
+
+    def window(self, start_ns: int, end_ns: int) -> Tuple[int, int]:
+        """Index range [lo, hi) of candles with start_ns <= time_ns < end_ns."""
+        lo = bisect_left(self.times_ns, start_ns)
+        return lo, bisect_left(self.times_ns, end_ns, lo)
+
+    def candle_at(self, target_ns: int) -> Optional[Tuple]:
+        """(time_ns, open, high, low, close) at exactly target_ns, or None."""
+        i = bisect_left(self.times_ns, target_ns)
+        if i == len(self.times_ns) or self.times_ns[i] != target_ns:
+            return None
+        return (self.times_ns[i], self.opens[i], self.highs[i], self.lows[i], self.closes[i])
+
+
 def get_candles(
     conn: sqlite3.Connection,
     symbol: str,
@@ -200,28 +305,72 @@ def get_candles(
         SELECT time, open, high, low, close
         FROM ohlc_1m
         WHERE symbol = ?
-        AND time >= ?
-        AND time < ?
-        ORDER BY time
-    """, (symbol, start_time.isoformat(), end_time.isoformat()))
+        AND time_ns >= ?
+        AND time_ns < ?
+        ORDER BY time_ns
+    """, (symbol, to_ns(start_time), to_ns(end_time)))
 
     return cursor.fetchall()
 
 
+def get_window_extremes(
+    conn: sqlite3.Connection,
+    symbol: str,
+    start_time: datetime,
+    end_time: datetime,
+    cache: Optional[SymbolCache] = None
+) -> Optional[Tuple[float, float]]:
+    """
+    Highest high and lowest low between start and end time (PoC window).
+
+    With a cache, max()/min() reduce the array('d') slices in C; otherwise
+    SQLite aggregates during its index range scan, so no rows are fetched.
+
+    Returns:
+        (highest, lowest), or None if the window has no candles
+    """
+    if cache is not None:
+        lo, hi = cache.window(to_ns(start_time), to_ns(end_time))
+        if lo == hi:
+            return None
+        return max(cache.highs[lo:hi]), min(cache.lows[lo:hi])
+
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT MAX(high), MIN(low)
+        FROM ohlc_1m
+        WHERE symbol = ?
+        AND time_ns >= ?
+        AND time_ns < ?
+    """, (symbol, to_ns(start_time), to_ns(end_time)))
+
+    highest, lowest = cursor.fetchone()
+    if highest is None:
+        return None
+    return highest, lowest
+
+
 def get_candle_at_time(
     conn: sqlite3.Connection,
     symbol: str,
-    target_time: datetime
+    target_time: datetime,
+    cache: Optional[SymbolCache] = None
 ) -> Optional[Tuple]:
     """Get candle at specific time."""
+    target_ns = to_ns(target_time)
+
+    if cache is not None:
+        return cache.candle_at(target_ns)
+
     cursor = conn.cursor()
 
     cursor.execute("""
         SELECT time, open, high, low, close
         FROM ohlc_1m
         WHERE symbol = ?
-        AND time = ?
-    """, (symbol, target_time.isoformat()))
+        AND time_ns = ?
+    """, (symbol, target_ns))
 
     return cursor.fetchone()
 
@@ -230,7 +379,9 @@ def calculate_major_session(
     conn: sqlite3.Connection,
     symbol: str,
     session_name: str,
-    trading_day: datetime
+    trading_day: datetime,
+    cache: Optional[SymbolCache] = None,
+    now_iso: Optional[str] = None
 ) -> Optional[Dict]:
     """
     Calculate a Major session (Asia, London, NY_AM, NY_PM, Afternoon).
@@ -245,6 +396,8 @@ def calculate_major_session(
         symbol: 'ES' or 'NQ'
         session_name: 'Asia', 'London', etc.
         trading_day: The trading day (date)
+        cache: Optional in-memory candles for the symbol (SymbolCache)
+        now_iso: created_at/updated_at stamp (defaults to now)
 
     Returns:
         Session dictionary or None
@@ -252,20 +405,20 @@ def calculate_major_session(
     session_def = MAJOR_SESSIONS[session_name]
 
     # Session start and end times (for reference/range)
-    session_start = ET.localize(datetime.combine(trading_day, session_def['start']))
-    session_end = ET.localize(datetime.combine(trading_day, session_def['end']))
+    session_start = et_dt(trading_day, session_def['start'])
+    session_end = et_dt(trading_day, session_def['end'])
 
     # Handle overnight sessions (Asia crosses midnight)
     if session_def['end'] < session_def['start']:
         session_end += timedelta(days=1)
 
     # True Open time (specific per session)
-    to_time = ET.localize(datetime.combine(trading_day, session_def['to_time']))
+    to_time = et_dt(trading_day, session_def['to_time'])
     if session_def['to_time'] < session_def['start']:
         to_time += timedelta(days=1)
 
     # Get TO candle
-    to_candle = get_candle_at_time(conn, symbol, to_time)
+    to_candle = get_candle_at_time(conn, symbol, to_time, cache)
     if not to_candle:
         return None  # No data at TO time
 
@@ -275,24 +428,24 @@ def calculate_major_session(
     if session_def['begin_looking'] == 'previous_close':
         # Start from closing price of previous trading day (same calendar day 16:59 candle)
         # Trading day ends at 16:59, so previous close is same calendar day as session start
-        begin_looking_time = ET.localize(datetime.combine(trading_day, time(16, 59)))
+        begin_looking_time = et_dt(trading_day, time(16, 59))
         # Get the close price of the previous trading day's last candle
-        prev_close_candle = get_candle_at_time(conn, symbol, begin_looking_time)
+        prev_close_candle = get_candle_at_time(conn, symbol, begin_looking_time, cache)
         if not prev_close_candle:
             return None
     else:  # 'session_open'
         # Start from session open
         begin_looking_time = session_start
 
-    # Get PoC window candles (from begin_looking through TO time, exclusive)
-    poc_candles = get_candles(conn, symbol, begin_looking_time, to_time)
-    if not poc_candles:
+    # Get PoC window (from begin_looking through TO time, exclusive)
+    extremes = get_window_extremes(conn, symbol, begin_looking_time, to_time, cache)
+    if not extremes:
         return None
 
     # Calculate PoC and RPP
-    poc, rpp = calculate_poc_and_rpp(poc_candles, to_price)
+    poc, rpp = calculate_poc_and_rpp(*extremes, to_price)
 
-    now = datetime.now(ET).isoformat()
+    now = now_iso or datetime.now(ET).isoformat()
 
     # Determine trading day for session name
     # Sessions starting at 18:00 or later belong to the next trading day
@@ -304,7 +457,7 @@ def calculate_major_session(
     return {
         'symbol': symbol,
         'session_type': 'Major',
-        'session_name': f'{session_name} {name_trading_day.strftime("%Y-%m-%d")}',
+        'session_name': f'{session_name} {name_trading_day.year:04d}-{name_trading_day.month:02d}-{name_trading_day.day:02d}',
         'session_start_time': session_start.isoformat(),
         'to_time': to_time.isoformat(),
         'true_open': to_price,
@@ -325,7 +478,9 @@ def calculate_minor_session(
     to_offset_minutes: int,
     duration_minutes: int,
     begin_looking: str,
-    trading_day: datetime
+    trading_day: datetime,
+    cache: Optional[SymbolCache] = None,
+    now_iso: Optional[str] = None
 ) -> Optional[Dict]:
     """
     Calculate a Minor session (m1800, m1930, etc.).
@@ -345,12 +500,14 @@ def calculate_minor_session(
         duration_minutes: Session duration (89 for most, 29 for m1630)
         begin_looking: 'previous_close' or 'session_open'
         trading_day: The trading day (date)
+        cache: Optional in-memory candles for the symbol (SymbolCache)
+        now_iso: created_at/updated_at stamp (defaults to now)
 
     Returns:
         Session dictionary or None
     """
     # Session start
-    session_start = ET.localize(datetime.combine(trading_day, session_start_time))
+    session_start = et_dt(trading_day, session_start_time)
 
     # Session end (for reference)
     session_end = session_start + timedelta(minutes=duration_minutes)
@@ -359,7 +516,7 @@ def calculate_minor_session(
     to_candle_time = session_start + timedelta(minutes=to_offset_minutes)
 
     # Get TO candle
-    to_candle = get_candle_at_time(conn, symbol, to_candle_time)
+    to_candle = get_candle_at_time(conn, symbol, to_candle_time, cache)
     if not to_candle:
         return None
 
@@ -372,25 +529,25 @@ def calculate_minor_session(
     if begin_looking == 'previous_close':
         # Start from closing price of previous trading day (same calendar day 16:59 candle)
         # Trading day ends at 16:59, so previous close is same calendar day as session start
-        begin_looking_time = ET.localize(datetime.combine(trading_day, time(16, 59)))
+        begin_looking_time = et_dt(trading_day, time(16, 59))
         # Verify we have the previous close candle
-        prev_close_candle = get_candle_at_time(conn, symbol, begin_looking_time)
+        prev_close_candle = get_candle_at_time(conn, symbol, begin_looking_time, cache)
         if not prev_close_candle:
             return None
     else:  # 'session_open'
         # Start from session open
         begin_looking_time = session_start
 
-    # Get PoC window candles (from begin_looking through TO candle time, inclusive of TO)
+    # Get PoC window (from begin_looking through TO candle time, inclusive of TO)
     poc_end_time = to_candle_time + timedelta(minutes=1)  # Include the TO candle
-    poc_candles = get_candles(conn, symbol, begin_looking_time, poc_end_time)
-    if not poc_candles:
+    extremes = get_window_extremes(conn, symbol, begin_looking_time, poc_end_time, cache)
+    if not extremes:
         return None
 
     # Calculate PoC and RPP
-    poc, rpp = calculate_poc_and_rpp(poc_candles, to_price)
+    poc, rpp = calculate_poc_and_rpp(*extremes, to_price)
 
-    now = datetime.now(ET).isoformat()
+    now = now_iso or datetime.now(ET).isoformat()
 
     # Determine trading day for session name
     # Sessions starting at 18:00 or later belong to the next trading day
@@ -402,7 +559,7 @@ def calculate_minor_session(
     return {
         'symbol': symbol,
         'session_type': 'Minor',
-        'session_name': f'{session_name} {name_trading_day.strftime("%Y-%m-%d")}',
+        'session_name': f'{session_name} {name_trading_day.year:04d}-{name_trading_day.month:02d}-{name_trading_day.day:02d}',
         'session_start_time': session_start.isoformat(),
         'to_time': to_candle_time.isoformat(),
         'true_open': to_price,
@@ -418,7 +575,9 @@ def calculate_minor_session(
 def calculate_weekly_session(
     conn: sqlite3.Connection,
     symbol: str,
-    week_start: datetime
+    week_start: datetime,
+    cache: Optional[SymbolCache] = None,
+    now_iso: Optional[str] = None
 ) -> Optional[Dict]:
     """
     Calculate a Weekly session.
@@ -427,6 +586,9 @@ def calculate_weekly_session(
     - PoC Tracking Begins: Sunday 18:00 (first candle of Monday trading day)
     - True Open (TO): Monday 18:00 (first candle of Tuesday trading day)
     - PoC Window: Sunday 18:00 → Monday 17:59 (24 hours, exclusive of TO)
+
+    With a cache (SymbolCache) the TO candle and PoC window come from memory;
+    now_iso stamps created_at/updated_at (defaults to now).
     """
     # Find Sunday of this week (day before Monday)
     # If week_start is a date, we need to find the Sunday that starts this week
@@ -441,7 +603,7 @@ def calculate_weekly_session(
     sunday = week_date - timedelta(days=days_since_sunday)
 
     # PoC window start: Sunday 18:00
-    poc_start = ET.localize(datetime.combine(sunday, time(18, 0)))
+    poc_start = et_dt(sunday, time(18, 0))
 
     # TO time: Monday 18:00 (24 hours after Sunday 18:00)
     to_time = poc_start + timedelta(days=1)
@@ -450,24 +612,24 @@ def calculate_weekly_session(
     poc_end = to_time - timedelta(minutes=1)
 
     # Get TO candle
-    to_candle = get_candle_at_time(conn, symbol, to_time)
+    to_candle = get_candle_at_time(conn, symbol, to_time, cache)
     if not to_candle:
         return None
 
     to_price = to_candle[1]  # open
 
-    # Get PoC window candles (Sunday 18:00 to Monday 17:59)
-    poc_candles = get_candles(conn, symbol, poc_start, to_time)
-    if not poc_candles:
+    # Get PoC window (Sunday 18:00 to Monday 17:59)
+    extremes = get_window_extremes(conn, symbol, poc_start, to_time, cache)
+    if not extremes:
         return None
 
     # Calculate PoC and RPP
-    poc, rpp = calculate_poc_and_rpp(poc_candles, to_price)
+    poc, rpp = calculate_poc_and_rpp(*extremes, to_price)
 
-    now = datetime.now(ET).isoformat()
+    now = now_iso or datetime.now(ET).isoformat()
 
     # Week name format: "Week of YYYY-MM-DD" (using Sunday date)
-    week_name = f'Week of {sunday.strftime("%Y-%m-%d")}'
+    week_name = f'Week of {sunday.year:04d}-{sunday.month:02d}-{sunday.day:02d}'
 
     return {
         'symbol': symbol,
@@ -528,7 +690,7 @@ def get_first_full_trading_day_of_month(year: int, month: int) -> datetime:
         # First trading day is Sunday same day at 18:00
         trading_day = first_of_month
 
-    return ET.localize(datetime.combine(trading_day.date(), time(18, 0)))
+    return et_dt(trading_day.date(), time(18, 0))
 
 
 def get_second_full_week_sunday(year: int, month: int) -> datetime:
@@ -569,14 +731,16 @@ def get_second_full_week_sunday(year: int, month: int) -> datetime:
     # The Sunday before this Monday at 18:00 is the TO
     second_full_week_sunday = second_full_week_monday - timedelta(days=1)
 
-    return ET.localize(datetime.combine(second_full_week_sunday.date(), time(18, 0)))
+    return et_dt(second_full_week_sunday.date(), time(18, 0))
 
 
 def calculate_monthly_session(
     conn: sqlite3.Connection,
     symbol: str,
     year: int,
-    month: int
+    month: int,
+    cache: Optional[SymbolCache] = None,
+    now_iso: Optional[str] = None
 ) -> Optional[Dict]:
     """
     Calculate a Monthly session.
@@ -591,6 +755,8 @@ def calculate_monthly_session(
         symbol: 'ES' or 'NQ'
         year: Year
         month: Month (1-12)
+        cache: Optional in-memory candles for the symbol (SymbolCache)
+        now_iso: created_at/updated_at stamp (defaults to now)
 
     Returns:
         Session dictionary or None if data is insufficient
@@ -600,25 +766,25 @@ def calculate_monthly_session(
     to_time = get_second_full_week_sunday(year, month)
 
     # Check if we have complete data coverage for the PoC window
-    if not has_complete_data(conn, symbol, poc_start, to_time, min_coverage_pct=0.80):
+    if not has_complete_data(conn, symbol, poc_start, to_time, min_coverage_pct=0.80, cache=cache):
         return None  # Insufficient data
 
     # Get TO candle
-    to_candle = get_candle_at_time(conn, symbol, to_time)
+    to_candle = get_candle_at_time(conn, symbol, to_time, cache)
     if not to_candle:
         return None
 
     to_price = to_candle[1]  # open price
 
-    # Get PoC window candles (from first full trading day through TO time, exclusive)
-    poc_candles = get_candles(conn, symbol, poc_start, to_time)
-    if not poc_candles:
+    # Get PoC window (from first full trading day through TO time, exclusive)
+    extremes = get_window_extremes(conn, symbol, poc_start, to_time, cache)
+    if not extremes:
         return None
 
     # Calculate PoC and RPP
-    poc, rpp = calculate_poc_and_rpp(poc_candles, to_price)
+    poc, rpp = calculate_poc_and_rpp(*extremes, to_price)
 
-    now = datetime.now(ET).isoformat()
+    now = now_iso or datetime.now(ET).isoformat()
 
     # Month name format: "YYYY-MM"
     month_name = f'{year}-{month:02d}'
@@ -674,13 +840,15 @@ def get_first_sunday_of_april(year: int) -> datetime:
             days_until_sunday = 7
         first_sunday = april_first + timedelta(days=days_until_sunday)
 
-    return ET.localize(datetime.combine(first_sunday.date(), time(18, 0)))
+    return et_dt(first_sunday.date(), time(18, 0))
 
 
 def calculate_yearly_session(
     conn: sqlite3.Connection,
     symbol: str,
-    year: int
+    year: int,
+    cache: Optional[SymbolCache] = None,
+    now_iso: Optional[str] = None
 ) -> Optional[Dict]:
     """
     Calculate a Yearly session.
@@ -695,6 +863,8 @@ def calculate_yearly_session(
         conn: Database connection
         symbol: 'ES' or 'NQ'
         year: Year
+        cache: Optional in-memory candles for the symbol (SymbolCache)
+        now_iso: created_at/updated_at stamp (defaults to now)
 
     Returns:
         Session dictionary or None if data is insufficient
@@ -704,25 +874,25 @@ def calculate_yearly_session(
     to_time = get_first_sunday_of_april(year)
 
     # Check if we have complete data coverage for the PoC window (Q1)
-    if not has_complete_data(conn, symbol, poc_start, to_time, min_coverage_pct=0.80):
+    if not has_complete_data(conn, symbol, poc_start, to_time, min_coverage_pct=0.80, cache=cache):
         return None  # Insufficient data
 
     # Get TO candle
-    to_candle = get_candle_at_time(conn, symbol, to_time)
+    to_candle = get_candle_at_time(conn, symbol, to_time, cache)
     if not to_candle:
         return None
 
     to_price = to_candle[1]  # open price
 
-    # Get PoC window candles (Q1: from first trading day through TO time, exclusive)
-    poc_candles = get_candles(conn, symbol, poc_start, to_time)
-    if not poc_candles:
+    # Get PoC window (Q1: from first trading day through TO time, exclusive)
+    extremes = get_window_extremes(conn, symbol, poc_start, to_time, cache)
+    if not extremes:
         return None
 
     # Calculate PoC and RPP
-    poc, rpp = calculate_poc_and_rpp(poc_candles, to_price)
+    poc, rpp = calculate_poc_and_rpp(*extremes, to_price)
 
-    now = datetime.now(ET).isoformat()
+    now = now_iso or datetime.now(ET).isoformat()
 
     return {
         'symbol': symbol,
@@ -740,180 +910,287 @@ def calculate_yearly_session(
     }
 
 
-def insert_session(conn: sqlite3.Connection, session: Dict) -> bool:
-    """Insert session, return True if inserted, False if duplicate."""
+# Sessions are written in executemany batches of at most this many rows
+SESSION_FLUSH_SIZE = 10_000
+
+# Session kinds, in calculation order; stats keys are '<kind>_created'/'_skipped'
+SESSION_KINDS = ('major', 'minor', 'weekly', 'monthly', 'yearly')
+
+# Duplicates (same symbol/type/name/start) are skipped, not raised
+INSERT_SESSION_SQL = """
+    INSERT OR IGNORE INTO sessions (
+        symbol, session_type, session_name,
+        session_start_time, to_time,
+        true_open, poc, rpp,
+        status, expires_at,
+        created_at, updated_at
+    ) VALUES (
+        :symbol, :session_type, :session_name,
+        :session_start_time, :to_time,
+        :true_open, :poc, :rpp,
+        :status, :expires_at,
+        :created_at, :updated_at
+    )
+"""
+
+
+def flush_sessions(
+    conn: sqlite3.Connection,
+    pending: Dict[str, List[Dict]],
+    stats: Dict
+):
+    """
+    Write buffered sessions with executemany, SESSION_FLUSH_SIZE rows at a time.
+
+    Args:
+        pending: Sessions keyed by kind ('major', 'minor', 'weekly', ...)
+        stats: Counters; '<kind>_created' / '<kind>_skipped' are updated
+
+    Runs inside the caller's transaction; the buffers are emptied.
+    """
     cursor = conn.cursor()
 
-    try:
-        cursor.execute("""
-            INSERT INTO sessions (
-                symbol, session_type, session_name,
-                session_start_time, to_time,
-                true_open, poc, rpp,
-                status, expires_at,
-                created_at, updated_at
-            ) VALUES (
-                :symbol, :session_type, :session_name,
-                :session_start_time, :to_time,
-                :true_open, :poc, :rpp,
-                :status, :expires_at,
-                :created_at, :updated_at
-            )
-        """, session)
-        return True
-    except sqlite3.IntegrityError:
-        return False  # Duplicate
+    for kind, rows in pending.items():
+        for i in range(0, len(rows), SESSION_FLUSH_SIZE):
+            batch = rows[i:i + SESSION_FLUSH_SIZE]
+            cursor.executemany(INSERT_SESSION_SQL, batch)
+            stats[f'{kind}_created'] += cursor.rowcount
+            stats[f'{kind}_skipped'] += len(batch) - cursor.rowcount
+        rows.clear()
+
+
+def drop_session_indexes(conn: sqlite3.Connection) -> List[str]:
+    """
+    Drop the secondary indexes on sessions, returning their DDL for rebuild.
+
+    The UNIQUE(symbol, session_type, session_name, session_start_time)
+    autoindex is kept: INSERT OR IGNORE relies on it for deduplication.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT name, sql FROM sqlite_master
+        WHERE type = 'index' AND tbl_name = 'sessions' AND sql IS NOT NULL
+    """)
+    indexes = cursor.fetchall()
+
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX "{name}"')
+
+    return [sql for _, sql in indexes]
+
+
+def rebuild_session_indexes(conn: sqlite3.Connection, index_ddl: List[str]):
+    """Re-create indexes dropped by drop_session_indexes."""
+    cursor = conn.cursor()
+    for sql in index_ddl:
+        cursor.execute(sql)
 
 
 def process_trading_day(
     conn: sqlite3.Connection,
     symbol: str,
-    trading_day: datetime
-) -> Dict:
+    trading_day: datetime,
+    pending: Dict[str, List[Dict]],
+    cache: Optional[SymbolCache] = None,
+    now_iso: Optional[str] = None
+):
     """
     Process all daily sessions for a single trading day.
 
-    Returns statistics.
+    Sessions are appended to pending['major'] / pending['minor'] for the
+    caller to write (see flush_sessions). With a cache the TO lookups and
+    PoC windows are served from memory instead of SQL.
     """
-    stats = {
-        'major_created': 0,
-        'minor_created': 0,
-        'major_skipped': 0,
-        'minor_skipped': 0
-    }
+    # Every Major/Minor TO candle falls on the trading day's calendar date,
+    # so a day without candles (Saturdays, holidays) can't produce a session
+    if cache is not None:
+        day_lo, day_hi = cache.window(
+            to_ns(et_dt(trading_day, time(0, 0))),
+            to_ns(et_dt(trading_day + timedelta(days=1), time(0, 0)))
+        )
+        if day_lo == day_hi:
+            return
 
     # Calculate Major sessions
     for session_name in MAJOR_SESSIONS.keys():
-        session = calculate_major_session(conn, symbol, session_name, trading_day)
+        session = calculate_major_session(conn, symbol, session_name, trading_day, cache, now_iso)
         if session:
-            if insert_session(conn, session):
-                stats['major_created'] += 1
-            else:
-                stats['major_skipped'] += 1
+            pending['major'].append(session)
 
     # Calculate Minor sessions
     for session_name, session_start_time, to_offset, duration, begin_looking in MINOR_SESSIONS:
         session = calculate_minor_session(
             conn, symbol, session_name, session_start_time,
-            to_offset, duration, begin_looking, trading_day
+            to_offset, duration, begin_looking, trading_day, cache, now_iso
         )
         if session:
-            if insert_session(conn, session):
-                stats['minor_created'] += 1
-            else:
-                stats['minor_skipped'] += 1
+            pending['minor'].append(session)
 
-    return stats
 
-
-def process_full(conn: sqlite3.Connection, symbols: List[str]) -> Dict:
-    """
-    Full mode: Calculate all sessions from scratch.
+def calculate_symbol_sessions(
+    symbol: str,
+    now_iso: str,
+    from_date: Optional[date] = None
+) -> Optional[Dict]:
     """
-    print("\nMODE: Full Processing")
-    print()
+    Calculate every session for one symbol without writing anything.
 
-    cursor = conn.cursor()
-    total_stats = {
-        'major_created': 0,
-        'minor_created': 0,
-        'weekly_created': 0,
-        'monthly_created': 0,
-        'yearly_created': 0,
-        'major_skipped': 0,
-        'minor_skipped': 0,
-        'weekly_skipped': 0,
-        'monthly_skipped': 0,
-        'yearly_skipped': 0
-    }
+    Runs in a worker process under process_full, so it opens its own
+    read-only connection. Returns None if the symbol has no data, otherwise
+    {'min_date', 'max_date', 'days_processed', 'sessions'} with sessions
+    keyed by kind (SESSION_KINDS).
 
-    for symbol in symbols:
-        print(f"\n{symbol}:")
-        print("-" * 80)
+    With from_date (incremental mode) only the trading days, weeks, months
+    and years from that date on are calculated; earlier ones already exist.
+    """
+    conn = get_db_connection(readonly=True)
 
+    try:
         # Get data range
-        data_range = get_data_range(symbol, cursor)
+        data_range = get_data_range(symbol, conn.cursor())
         if not data_range['min_time']:
-            print(f"  No data for {symbol}, skipping")
-            continue
+            return None
 
         min_date = datetime.fromisoformat(data_range['min_time']).date()
         max_date = datetime.fromisoformat(data_range['max_time']).date()
+        if from_date is not None and from_date > min_date:
+            min_date = from_date
 
-        print(f"  Data range: {min_date} to {max_date}")
-        print(f"  Processing daily sessions...")
+        cache = SymbolCache(conn, symbol)
+        sessions = {kind: [] for kind in SESSION_KINDS}
 
         # Process each trading day
-        current_date = min_date
-        days_processed = 0
+        day_ordinals = range(min_date.toordinal(), max_date.toordinal() + 1)
+        for ordinal in day_ordinals:
+            process_trading_day(conn, symbol, date.fromordinal(ordinal), sessions, cache, now_iso)
 
-        while current_date <= max_date:
-            day_stats = process_trading_day(conn, symbol, current_date)
-
-            for key in ['major_created', 'minor_created', 'major_skipped', 'minor_skipped']:
-                total_stats[key] += day_stats[key]
-
-            days_processed += 1
-            current_date += timedelta(days=1)
-
-        print(f"  Days processed: {days_processed}")
-        print(f"  Major sessions: {total_stats['major_created']} created")
-        print(f"  Minor sessions: {total_stats['minor_created']} created")
-
-        # Process weekly sessions
-        print(f"\n  Processing weekly sessions...")
+        # Weekly sessions
         current_week = min_date
         while current_week <= max_date:
-            session = calculate_weekly_session(conn, symbol, current_week)
+            session = calculate_weekly_session(conn, symbol, current_week, cache, now_iso)
             if session:
-                if insert_session(conn, session):
-                    total_stats['weekly_created'] += 1
-                else:
-                    total_stats['weekly_skipped'] += 1
+                sessions['weekly'].append(session)
 
             current_week += timedelta(weeks=1)
 
-        print(f"  Weekly sessions: {total_stats['weekly_created']} created")
+        # Monthly sessions (every month touched by the data range)
+        first_month = min_date.year * 12 + min_date.month - 1
+        last_month = max_date.year * 12 + max_date.month - 1
+        for month_index in range(first_month, last_month + 1):
+            year, month = divmod(month_index, 12)
+            session = calculate_monthly_session(conn, symbol, year, month + 1, cache, now_iso)
+            if session:
+                sessions['monthly'].append(session)
+
+        # Yearly sessions
+        for year in range(min_date.year, max_date.year + 1):
+            session = calculate_yearly_session(conn, symbol, year, cache, now_iso)
+            if session:
+                sessions['yearly'].append(session)
+
+        return {
+            'min_date': min_date,
+            'max_date': max_date,
+            'days_processed': len(day_ordinals),
+            'sessions': sessions
+        }
+
+    finally:
+        conn.close()
+
+
+def process_full(
+    conn: sqlite3.Connection,
+    symbols: List[str],
+    incremental: bool = False
+) -> Dict:
+    """
+    Full mode: Calculate all sessions from scratch.
+
+    Symbols are independent, so each is calculated in its own worker process
+    (calculate_symbol_sessions, read-only connection). This connection stays
+    the only writer: it inserts each symbol's sessions as results arrive.
+
+    Incremental mode resumes each symbol from its 'session_calc' watermark
+    (the last candle time covered by the previous run, see main), so only
+    the trading day holding the watermark and later days are recalculated.
+    """
+    print(f"\nMODE: {'Incremental' if incremental else 'Full'} Processing")
+    print()
+
+    total_stats = {
+        'major_created': 0,
+        'minor_created': 0,
+        'weekly_created': 0,
+        'monthly_created': 0,
+        'yearly_created': 0,
+        'major_skipped': 0,
+        'minor_skipped': 0,
+        'weekly_skipped': 0,
+        'monthly_skipped': 0,
+        'yearly_skipped': 0
+    }
+
+    # One created_at/updated_at stamp for the whole run
+    now_iso = datetime.now(ET).isoformat()
 
-        # Process monthly sessions
-        print(f"\n  Processing monthly sessions...")
-        year_month_set = set()
-        current_date = min_date
+    from_dates = [None] * len(symbols)
+    if incremental:
+        cursor = conn.cursor()
+        for i, symbol in enumerate(symbols):
+            watermark = get_last_processed_time(symbol, 'session_calc', cursor)
+            if watermark:
+                from_dates[i] = datetime.fromisoformat(watermark).date()
+                print(f"{symbol}: resuming from watermark {watermark}")
+
+    # Bulk load: maintain secondary indexes once at the end instead of per
+    # insert (not worth it for an incremental top-up). Opened explicitly so
+    # the DROPs share the caller's transaction and roll back with it.
+    if not conn.in_transaction:
+        conn.execute('BEGIN IMMEDIATE')
+    index_ddl = [] if incremental else drop_session_indexes(conn)
+
+    if len(symbols) > 1:
+        # spawn: workers must not inherit this connection's open transaction
+        executor = ProcessPoolExecutor(
+            max_workers=len(symbols),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        results = executor.map(calculate_symbol_sessions, symbols, [now_iso] * len(symbols), from_dates)
+    else:
+        executor = None
+        results = map(calculate_symbol_sessions, symbols, [now_iso], from_dates)
 
-        while current_date <= max_date:
-            year_month = (current_date.year, current_date.month)
-            if year_month not in year_month_set:
-                year_month_set.add(year_month)
-                session = calculate_monthly_session(conn, symbol, year_month[0], year_month[1])
-                if session:
-                    if insert_session(conn, session):
-                        total_stats['monthly_created'] += 1
-                    else:
-                        total_stats['monthly_skipped'] += 1
+    try:
+        for symbol, result in zip(symbols, results):
+            print(f"\n{symbol}:")
+            print("-" * 80)
 
-            current_date += timedelta(days=1)
+            if result is None:
+                print(f"  No data for {symbol}, skipping")
+                continue
 
-        print(f"  Monthly sessions: {total_stats['monthly_created']} created")
+            print(f"  Data range: {result['min_date']} to {result['max_date']}")
 
-        # Process yearly sessions
-        print(f"\n  Processing yearly sessions...")
-        year_set = set()
-        current_date = min_date
+            symbol_stats = dict.fromkeys(total_stats, 0)
+            flush_sessions(conn, result['sessions'], symbol_stats)
 
-        while current_date <= max_date:
-            year = current_date.year
-            if year not in year_set:
-                year_set.add(year)
-                session = calculate_yearly_session(conn, symbol, year)
-                if session:
-                    if insert_session(conn, session):
-                        total_stats['yearly_created'] += 1
-                    else:
-                        total_stats['yearly_skipped'] += 1
+            print(f"  Days processed: {result['days_processed']}")
+            print(f"  Major sessions: {symbol_stats['major_created']} created")
+            print(f"  Minor sessions: {symbol_stats['minor_created']} created")
+            print(f"  Weekly sessions: {symbol_stats['weekly_created']} created")
+            print(f"  Monthly sessions: {symbol_stats['monthly_created']} created")
+            print(f"  Yearly sessions: {symbol_stats['yearly_created']} created")
 
-            current_date += timedelta(days=1)
+            for key, count in symbol_stats.items():
+                total_stats[key] += count
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-        print(f"  Yearly sessions: {total_stats['yearly_created']} created")
+    if index_ddl:
+        rebuild_session_indexes(conn, index_ddl)
+        print(f"\nRebuilt {len(index_ddl)} session indexes")
 
     return total_stats
 
@@ -927,13 +1204,13 @@ def main():
     parser.add_argument('--full', action='store_true',
                         help='Full mode: Calculate all sessions')
     parser.add_argument('--incremental', action='store_true',
-                        help='Incremental mode: Only new/affected sessions')
+                        help='Incremental mode: Resume from the last session_calc watermark')
     parser.add_argument('--symbol', type=str, choices=['ES', 'NQ'],
                         help='Process only this symbol')
 
     args = parser.parse_args()
 
-    # Default to full for now (incremental mode will be added later)
+    # Default to full for now
     if not args.full and not args.incremental:
         args.full = True
 
@@ -946,7 +1223,7 @@ def main():
     conn = get_db_connection()
 
     try:
-        stats = process_full(conn, symbols)
+        stats = process_full(conn, symbols, incremental=not args.full)
 
         conn.commit()
 
@@ -20,26 +20,179 @@ Usage:
 
 import sqlite3
 import argparse
+import multiprocessing
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-import pytz
+from zoneinfo import ZoneInfo
 from metadata_helpers import (
     get_last_processed_time,
-    update_processing_metadata,
-    get_data_range
+    update_processing_metadata_many,
+    get_data_range,
+    get_data_ranges
 )
 from affected_sessions import (
     find_affected_sessions,
     mark_sessions_for_recalc,
-    clear_recalc_flag,
-    get_sessions_needing_recalc
+    clear_recalc_flags,
+    get_sessions_needing_recalc,
+    invalidate_affected_sessions_cache,
+    configure_connection,
+    STATEMENT_CACHE_SIZE
 )
 
 # Database path
 DB_PATH = 'data/yearly_monthly.db'
 
 # Timezone
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('US/Eastern')
+
+# Calendar offsets indexed by weekday() (0=Monday ... 6=Sunday)
+# Days from that day forward to the next Monday (0 if already Monday)
+_DAYS_UNTIL_MONDAY = (0, 6, 5, 4, 3, 2, 1)
+# Days back to the 18:00 that starts that day's trading session:
+# the previous day, except Sunday which starts Sunday 18:00 (same day)
+_PREV_DAY_OFFSET = (1, 1, 1, 1, 1, 1, 0)
+
+# English month names for Monthly session names, indexed by month (1-12).
+# Spelled out rather than strftime('%B') so names never depend on the locale.
+_MONTH_NAMES = (
+    '', 'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+# Memoized has_full_day_data() results keyed by
+# (symbol, trading_start epoch, min_candles). The same trading days are probed
+# by the Yearly and Monthly calendar helpers (e.g. January's first full day,
+# a month's first Monday), and ohlc_4h is not written while sessions are
+# calculated. process_full()/process_incremental() start from empty caches.
+_full_day_cache: Dict[Tuple[str, int, int], bool] = {}
+
+# Memoized get_first_full_trading_day() / first-Monday results keyed by
+# (symbol, year, month): each is asked for by the Monthly session and again by
+# the Yearly session or get_second_full_week_sunday(). First-Monday entries
+# are (first Monday with data, Sunday 18:00 trading start) pairs.
+_first_full_day_cache: Dict[Tuple[str, int, int], datetime] = {}
+_first_monday_cache: Dict[Tuple[str, int, int], Tuple[datetime, datetime]] = {}
+
+# In-memory 4H candles per symbol (see SymbolCache), filled by
+# load_symbol_caches(); get_window_extremes(), get_candle_at_time() and
+# has_full_day_data() fall back to SQL for symbols that are not loaded.
+_symbol_caches: Dict[str, 'SymbolCache'] = {}
+
+
+def invalidate_4h_caches() -> None:
+    """Discard in-memory 4H candles and memoized probes (after loading 4H data)."""
+    _full_day_cache.clear()
+    _first_full_day_cache.clear()
+    _first_monday_cache.clear()
+    _symbol_caches.clear()
+
+# ============================================================================
+# Queries on ohlc_4h
+# ============================================================================
+# All are (symbol, time_epoch) lookups served by idx_ohlc_symbol_time_epoch
+# (see create_yearly_monthly_db.py / migrate_add_ohlc_time_epoch_4h.py);
+# check_candle_query_plans() verifies that. Bounds are bound with to_epoch().
+
+QUERY_4H_SYMBOL = """
+    SELECT time_epoch, open, high, low, close
+    FROM ohlc_4h
+    WHERE symbol = ?
+    ORDER BY time_epoch
+"""
+
+QUERY_4H_RANGE = """
+    SELECT time, open, high, low, close
+    FROM ohlc_4h
+    WHERE symbol = ?
+    AND time_epoch >= ?
+    AND time_epoch < ?
+    ORDER BY time_epoch
+"""
+
+QUERY_4H_EXTREMES = """
+    SELECT MAX(high), MIN(low)
+    FROM ohlc_4h
+    WHERE symbol = ?
+    AND time_epoch >= ?
+    AND time_epoch < ?
+"""
+
+QUERY_4H_COUNT = """
+    SELECT COUNT(*)
+    FROM ohlc_4h
+    WHERE symbol = ?
+    AND time_epoch >= ?
+    AND time_epoch < ?
+"""
+
+QUERY_4H_AT = """
+    SELECT time, open, high, low, close
+    FROM ohlc_4h
+    WHERE symbol = ?
+    AND time_epoch = ?
+"""
+
+
+def to_epoch(dt: datetime) -> int:
+    """Epoch seconds for an aware datetime (same values as ohlc_4h.time_epoch)."""
+    return int(dt.timestamp())
+
+
+@lru_cache(maxsize=None)
+def _first_day_candidates(year: int, month: int) -> Tuple[Tuple[datetime, datetime], ...]:
+    """
+    (calendar day, trading start) for the first 7 days of the month.
+
+    Pure calendar arithmetic, computed once per month and shared by every
+    symbol and session type; get_first_full_trading_day() probes these in
+    order for the first one with full data.
+    """
+    current_day = datetime(year, month, 1, tzinfo=ET)
+    candidates = []
+
+    for _ in range(7):
+        # Rule: Each calendar day's trading session starts at 18:00 the PREVIOUS day
+        # Exception: Sunday's trading session starts Sunday 18:00 (same day)
+        trading_day = current_day - timedelta(days=_PREV_DAY_OFFSET[current_day.weekday()])
+
+        # Set time to 18:00
+        trading_day = trading_day.replace(hour=18, minute=0, second=0, microsecond=0)
+
+        candidates.append((current_day, trading_day))
+        current_day += timedelta(days=1)
+
+    return tuple(candidates)
+
+
+@lru_cache(maxsize=None)
+def _first_monday_candidates(year: int, month: int) -> Tuple[Tuple[datetime, datetime], ...]:
+    """
+    (Monday, Sunday 18:00 trading start) for the month's first 4 Mondays.
+
+    Pure calendar arithmetic, computed once per month; probed in order by
+    get_first_monday_trading_time().
+    """
+    first_day = datetime(year, month, 1, tzinfo=ET)
+
+    # Find first Monday of the month
+    first_monday = first_day + timedelta(days=_DAYS_UNTIL_MONDAY[first_day.weekday()])
+
+    candidates = []
+    for _ in range(4):
+        # Get the 18:00 time that starts this Monday's trading
+        # Monday's trading starts the previous day (Sunday) at 18:00
+        trading_start = first_monday - timedelta(days=1)
+        trading_start = trading_start.replace(hour=18, minute=0, second=0, microsecond=0)
+
+        candidates.append((first_monday, trading_start))
+        first_monday += timedelta(weeks=1)
+
+    return tuple(candidates)
 
 
 def get_first_full_trading_day(year: int, month: int, conn: sqlite3.Connection = None, symbol: str = None) -> datetime:
@@ -57,34 +210,30 @@ def get_first_full_trading_day(year: int, month: int, conn: sqlite3.Connection =
     Returns:
         datetime: First full trading day at 18:00 ET with complete data
     """
-    first_day = datetime(year, month, 1)
-    first_day = ET.localize(first_day)
+    candidates = _first_day_candidates(year, month)
 
-    # Try up to 7 days to find the first day with full data
-    max_attempts = 7
-    attempts = 0
-    current_day = first_day
+    # If no connection provided, just return the first day (legacy behavior)
+    if conn is None or symbol is None:
+        return candidates[0][1]
 
-    while attempts < max_attempts:
-        # What day of week is this day?
-        # 0=Monday, 1=Tuesday, 2=Wednesday, 3=Thursday, 4=Friday, 5=Saturday, 6=Sunday
-        day_of_week = current_day.weekday()
+    key = (symbol, year, month)
+    if key not in _first_full_day_cache:
+        _first_full_day_cache[key] = _find_first_full_trading_day(conn, symbol, year, month, candidates)
+    return _first_full_day_cache[key]
 
-        # Rule: Each calendar day's trading session starts at 18:00 the PREVIOUS day
-        # Exception: Sunday's trading session starts Sunday 18:00 (same day)
-        if day_of_week == 6:  # Sunday
-            # Sunday's trading session starts Sunday 18:00 (same day)
-            trading_day = current_day
-        else:  # Monday through Saturday (0-5)
-            # Go back 1 day (each day's trading session starts previous day at 18:00)
-            trading_day = current_day - timedelta(days=1)
 
-        # Set time to 18:00
-        trading_day = trading_day.replace(hour=18, minute=0, second=0, microsecond=0)
+def _find_first_full_trading_day(
+    conn: sqlite3.Connection,
+    symbol: str,
+    year: int,
+    month: int,
+    candidates: Tuple[Tuple[datetime, datetime], ...]
+) -> datetime:
+    """Probe the month's first days in order; see get_first_full_trading_day()."""
+    # Try up to 7 days to find the first day with full data
+    max_attempts = len(candidates)
 
-        # If no connection provided, just return the first day (legacy behavior)
-        if conn is None or symbol is None:
-            return trading_day
+    for attempts, (current_day, trading_day) in enumerate(candidates):
 
         # Check if we have FULL day's worth of trading data (6 4H candles minimum)
         if has_full_day_data(conn, symbol, trading_day):
@@ -97,9 +246,6 @@ def get_first_full_trading_day(year: int, month: int, conn: sqlite3.Connection =
         if attempts == 0:
             print(f"  [INFO] Day {current_day.strftime('%Y-%m-%d')} in {year}-{month:02d} has incomplete data - checking next day")
 
-        current_day += timedelta(days=1)
-        attempts += 1
-
     # If we exhausted attempts, return the last day we tried
     print(f"  [WARN] No day with full data found in {year}-{month:02d} after {max_attempts} attempts - using last attempted day")
     return trading_day
@@ -122,55 +268,57 @@ def get_first_monday_trading_time(year: int, month: int, conn: sqlite3.Connectio
     Returns:
         datetime: 18:00 time that starts first Monday's trading with data
     """
-    first_day = datetime(year, month, 1)
-    first_day = ET.localize(first_day)
+    return _get_first_monday(year, month, conn, symbol)[1]
 
-    # Find first Monday of the month
-    day_of_week = first_day.weekday()  # 0=Mon, 6=Sun
 
-    if day_of_week == 0:  # First day is Monday
-        first_monday = first_day
-    else:
-        # Days until next Monday
-        if day_of_week == 6:  # Sunday
-            days_until_monday = 1
-        else:  # Tuesday-Saturday
-            days_until_monday = 7 - day_of_week
-        first_monday = first_day + timedelta(days=days_until_monday)
-
-    # If we have conn and symbol, validate that this Monday has FULL trading data
-    # If not, keep trying next Mondays (max 4 attempts)
-    max_attempts = 4
-    attempts = 0
+def _get_first_monday(
+    year: int,
+    month: int,
+    conn: Optional[sqlite3.Connection],
+    symbol: Optional[str]
+) -> Tuple[datetime, datetime]:
+    """(first Monday, Sunday 18:00 trading start); see get_first_monday_trading_time()."""
+    candidates = _first_monday_candidates(year, month)
+
+    # If no connection provided, just return the first Monday (legacy behavior)
+    if conn is None or symbol is None:
+        return candidates[0]
+
+    key = (symbol, year, month)
+    if key not in _first_monday_cache:
+        _first_monday_cache[key] = _find_first_monday_trading_time(conn, symbol, year, month, candidates)
+    return _first_monday_cache[key]
 
-    while attempts < max_attempts:
-        # Get the 18:00 time that starts this Monday's trading
-        # Monday's trading starts the previous day (Sunday) at 18:00
-        trading_start = first_monday - timedelta(days=1)
-        trading_start = trading_start.replace(hour=18, minute=0, second=0, microsecond=0)
 
-        # If no connection provided, just return the first Monday (legacy behavior)
-        if conn is None or symbol is None:
-            return trading_start
+def _find_first_monday_trading_time(
+    conn: sqlite3.Connection,
+    symbol: str,
+    year: int,
+    month: int,
+    candidates: Tuple[Tuple[datetime, datetime], ...]
+) -> Tuple[datetime, datetime]:
+    """Probe the month's Mondays in order; see get_first_monday_trading_time()."""
+    # Validate that this Monday has FULL trading data
+    # If not, keep trying next Mondays (max 4 attempts)
+    max_attempts = len(candidates)
+
+    for attempts, (first_monday, trading_start) in enumerate(candidates):
 
         # Check if we have FULL day's worth of trading data (6 4H candles minimum)
         if has_full_day_data(conn, symbol, trading_start):
             # Found full day - this is our first Monday with complete data
             if attempts > 0:
                 print(f"  [INFO] First Monday with full data is {first_monday.strftime('%Y-%m-%d')} (skipped {attempts} incomplete Monday(s))")
-            return trading_start
+            return first_monday, trading_start
 
         # Incomplete or no data - try next Monday
         if attempts == 0:
             print(f"  [INFO] Monday {first_monday.strftime('%Y-%m-%d')} in {year}-{month:02d} has incomplete data - checking next Monday")
 
-        first_monday += timedelta(weeks=1)
-        attempts += 1
-
     # If we exhausted attempts, return the last Monday we tried
     # (This maintains backward compatibility but logs a warning)
     print(f"  [WARN] No Monday with full data found in {year}-{month:02d} after {max_attempts} attempts - using last attempted Monday")
-    return trading_start
+    return first_monday, trading_start
 
 
 def get_second_full_week_sunday(year: int, month: int, conn: sqlite3.Connection = None, symbol: str = None) -> datetime:
@@ -189,43 +337,19 @@ def get_second_full_week_sunday(year: int, month: int, conn: sqlite3.Connection
     Returns:
         datetime: Sunday 18:00 that starts second Monday's trading
     """
-    # If we have conn and symbol, get the first Monday WITH complete data
-    # Otherwise fall back to calendar-based first Monday
-    if conn is not None and symbol is not None:
-        # Use get_first_monday_trading_time to get first Monday with data
-        first_monday_trading_start = get_first_monday_trading_time(year, month, conn, symbol)
-        # This returns Sunday 18:00 (timezone-aware), so we need to add 1 day to get the actual Monday
-        first_monday_aware = first_monday_trading_start + timedelta(days=1)
-        # Convert to naive datetime for processing
-        first_monday = first_monday_aware.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
-    else:
-        # Legacy behavior: calendar-based first Monday
-        first_day = datetime(year, month, 1)
-        day_of_week = first_day.weekday()
-
-        if day_of_week == 0:  # Already Monday
-            first_monday = first_day
-        else:
-            if day_of_week == 6:  # Sunday
-                days_until_monday = 1
-            else:  # Tuesday-Saturday
-                days_until_monday = 7 - day_of_week
-            first_monday = first_day + timedelta(days=days_until_monday)
+    # First Monday WITH complete data (calendar first Monday without conn/symbol)
+    first_monday, _ = _get_first_monday(year, month, conn, symbol)
 
-    # Second Monday is always 1 week after first Monday (with data)
+    # Second Monday is always 1 week after first Monday (with data); the TO
+    # time is the Sunday 18:00 before it. first_monday is ET-aware, so this is
+    # wall-clock arithmetic and zoneinfo resolves the DST offset.
     second_monday = first_monday + timedelta(weeks=1)
-
-    # Sunday 18:00 before second Monday is the TO time
-    second_monday_sunday_naive = (second_monday - timedelta(days=1)).replace(hour=18, minute=0, second=0, microsecond=0)
-
-    # Localize to ET, letting pytz determine DST automatically
-    second_monday_sunday = ET.localize(second_monday_sunday_naive, is_dst=None)
-
-    return second_monday_sunday
+    return (second_monday - timedelta(days=1)).replace(hour=18)
 
 
 def calculate_poc_and_rpp(
-    candles: List[Tuple],
+    highest: float,
+    lowest: float,
     to_price: float
 ) -> Tuple[float, float]:
     """
@@ -235,19 +359,13 @@ def calculate_poc_and_rpp(
     RPP = 2 * TO - PoC (mirror projection)
 
     Args:
-        candles: List of (time, open, high, low, close) tuples
+        highest: Highest high in the PoC window (see get_window_extremes)
+        lowest: Lowest low in the PoC window
         to_price: True Open price
 
     Returns:
         Tuple of (poc, rpp)
     """
-    if not candles:
-        return None, None
-
-    # Find highest high and lowest low in the window
-    highest = max(candle[2] for candle in candles)  # high
-    lowest = min(candle[3] for candle in candles)   # low
-
     # Calculate variance from TO
     high_variance = abs(highest - to_price)
     low_variance = abs(lowest - to_price)
@@ -264,6 +382,50 @@ def calculate_poc_and_rpp(
     return poc, rpp
 
 
+class SymbolCache:
+    """
+    All of one symbol's 4H candles held column-wise in memory.
+
+    Times are epoch seconds in an array('q') (same values as
+    ohlc_4h.time_epoch), so bisect over them matches the SQL range queries;
+    prices are array('d').
+    A decade of 4H data is ~11k rows per symbol, so loading it once replaces
+    every per-session SELECT.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, symbol: str):
+        # Transpose rows to columns in one C-level pass
+        rows = conn.execute(QUERY_4H_SYMBOL, (symbol,)).fetchall()
+        times, opens, highs, lows, closes = list(zip(*rows)) or [()] * 5
+
+        self.symbol = symbol
+        self.times_epoch = array('q', times)
+        self.opens = array('d', opens)
+        self.highs = array('d', highs)
+        self.lows = array('d', lows)
+        self.closes = array('d', closes)
+        # TO-candle probes are exact-time lookups: hash instead of bisect
+        self.index_by_time = {epoch: i for i, epoch in enumerate(self.times_epoch)}
+
+    def window(self, start_epoch: int, end_epoch: int) -> Tuple[int, int]:
+        """Index range [lo, hi) of candles with start_epoch <= time_epoch < end_epoch."""
+        lo = bisect_left(self.times_epoch, start_epoch)
+        return lo, bisect_left(self.times_epoch, end_epoch, lo)
+
+    def candle_at(self, target_epoch: int) -> Optional[Tuple]:
+        """(time_epoch, open, high, low, close) at exactly target_epoch, or None."""
+        i = self.index_by_time.get(target_epoch)
+        if i is None:
+            return None
+        return (self.times_epoch[i], self.opens[i], self.highs[i], self.lows[i], self.closes[i])
+
+
+def load_symbol_caches(conn: sqlite3.Connection, symbols: List[str]):
+    """Load each symbol's 4H candles into memory for the session loops."""
+    for symbol in symbols:
+        _symbol_caches[symbol] = SymbolCache(conn, symbol)
+
+
 def get_ohlc_candles(
     conn: sqlite3.Connection,
     symbol: str,
@@ -282,22 +444,45 @@ def get_ohlc_candles(
     Returns:
         List of (time, open, high, low, close) tuples
     """
-    cursor = conn.cursor()
+    return conn.execute(QUERY_4H_RANGE, (symbol, to_epoch(start_time), to_epoch(end_time))).fetchall()
 
-    # Convert to ISO format strings
-    start_str = start_time.isoformat()
-    end_str = end_time.isoformat()
 
-    cursor.execute("""
-        SELECT time, open, high, low, close
-        FROM ohlc_4h
-        WHERE symbol = ?
-        AND time >= ?
-        AND time < ?
-        ORDER BY time
-    """, (symbol, start_str, end_str))
+def get_window_extremes(
+    conn: sqlite3.Connection,
+    symbol: str,
+    start_time: datetime,
+    end_time: datetime
+) -> Optional[Tuple[float, float]]:
+    """
+    Highest high and lowest low between start and end time (PoC window).
 
-    return cursor.fetchall()
+    With the symbol cached, max()/min() reduce the array('d') slices in C;
+    otherwise SQLite aggregates during its index range scan, so no candle
+    rows are fetched.
+
+    Args:
+        conn: Database connection
+        symbol: 'ES' or 'NQ'
+        start_time: Start datetime (inclusive)
+        end_time: End datetime (exclusive)
+
+    Returns:
+        (highest, lowest), or None if the window has no candles
+    """
+    start_epoch = to_epoch(start_time)
+    end_epoch = to_epoch(end_time)
+
+    cache = _symbol_caches.get(symbol)
+    if cache is not None:
+        lo, hi = cache.window(start_epoch, end_epoch)
+        if lo == hi:
+            return None
+        return max(cache.highs[lo:hi]), min(cache.lows[lo:hi])
+
+    highest, lowest = conn.execute(QUERY_4H_EXTREMES, (symbol, start_epoch, end_epoch)).fetchone()
+    if highest is None:
+        return None
+    return highest, lowest
 
 
 def get_candle_at_time(
@@ -316,18 +501,13 @@ def get_candle_at_time(
     Returns:
         Tuple of (time, open, high, low, close) or None
     """
-    cursor = conn.cursor()
-    time_str = target_time.isoformat()
+    target_epoch = to_epoch(target_time)
 
-    cursor.execute("""
-        SELECT time, open, high, low, close
-        FROM ohlc_4h
-        WHERE symbol = ?
-        AND time = ?
-    """, (symbol, time_str))
+    cache = _symbol_caches.get(symbol)
+    if cache is not None:
+        return cache.candle_at(target_epoch)
 
-    result = cursor.fetchone()
-    return result
+    return conn.execute(QUERY_4H_AT, (symbol, target_epoch)).fetchone()
 
 
 def has_full_day_data(
@@ -351,19 +531,44 @@ def has_full_day_data(
     Returns:
         bool: True if full day's data exists, False otherwise
     """
+    start_epoch = to_epoch(trading_start)
+    key = (symbol, start_epoch, min_candles)
+    cached = _full_day_cache.get(key)
+    if cached is not None:
+        return cached
+
     # End of trading day is 18:00 next day (24 hours later)
-    trading_end = trading_start + timedelta(hours=24)
+    end_epoch = to_epoch(trading_start + timedelta(hours=24))
+
+    # Count the candles in this trading day (no rows are materialized)
+    cache = _symbol_caches.get(symbol)
+    if cache is not None:
+        lo, hi = cache.window(start_epoch, end_epoch)
+        count = hi - lo
+    else:
+        count = conn.execute(QUERY_4H_COUNT, (symbol, start_epoch, end_epoch)).fetchone()[0]
+
+    result = count >= min_candles
+
+    _full_day_cache[key] = result
+    return result
+
 
-    # Get all candles in this trading day
-    candles = get_ohlc_candles(conn, symbol, trading_start, trading_end)
+def yearly_session_name(year: int) -> str:
+    """Session name of a Yearly session, e.g. "Year 2019"."""
+    return f'Year {year}'
 
-    return len(candles) >= min_candles
+
+def monthly_session_name(year: int, month: int) -> str:
+    """Session name of a Monthly session, e.g. "January 2019"."""
+    return f'{_MONTH_NAMES[month]} {year}'
 
 
 def calculate_yearly_session(
     conn: sqlite3.Connection,
     year: int,
-    symbol: str
+    symbol: str,
+    now_iso: Optional[str] = None
 ) -> Optional[Dict]:
     """
     Calculate Yearly session for a given year and symbol.
@@ -372,6 +577,7 @@ def calculate_yearly_session(
         conn: Database connection
         year: Calendar year
         symbol: 'ES' or 'NQ'
+        now_iso: created_at/updated_at stamp (defaults to now)
 
     Returns:
         Dict with session data or None if data missing
@@ -385,7 +591,7 @@ def calculate_yearly_session(
     # PoC window: session_start through end of March (exclusive of TO candle)
     # End of March is March 31 23:59:59
     end_of_march = datetime(year, 3, 31, 23, 59, 59)
-    end_of_march = ET.localize(end_of_march)
+    end_of_march = end_of_march.replace(tzinfo=ET)
 
     # Get TO candle
     to_candle = get_candle_at_time(conn, symbol, to_time)
@@ -395,22 +601,24 @@ def calculate_yearly_session(
 
     to_price = to_candle[1]  # open price
 
-    # Get PoC window candles
-    poc_candles = get_ohlc_candles(conn, symbol, session_start, end_of_march)
-    if not poc_candles:
+    # Get PoC window extremes
+    extremes = get_window_extremes(conn, symbol, session_start, end_of_march)
+    if extremes is None:
         print(f"  [WARN] No PoC candles found for {year} Yearly {symbol}")
         return None
 
     # Calculate PoC and RPP
-    poc, rpp = calculate_poc_and_rpp(poc_candles, to_price)
+    poc, rpp = calculate_poc_and_rpp(*extremes, to_price)
 
     # Create session record
-    now = datetime.now(ET).isoformat()
+    now = now_iso or datetime.now(ET).isoformat()
 
     session = {
         'symbol': symbol,
         'session_type': 'Yearly',
-        'session_name': f'Year {year}',  # e.g., "Year 2019"
+        'session_name': yearly_session_name(year),  # e.g., "Year 2019"
+        'period_year': year,
+        'period_month': None,
         'session_start_time': session_start.isoformat(),
         'to_time': to_time.isoformat(),
         'true_open': to_price,
@@ -429,7 +637,8 @@ def calculate_monthly_session(
     conn: sqlite3.Connection,
     year: int,
     month: int,
-    symbol: str
+    symbol: str,
+    now_iso: Optional[str] = None
 ) -> Optional[Dict]:
     """
     Calculate Monthly session for a given month and symbol.
@@ -439,6 +648,7 @@ def calculate_monthly_session(
         year: Year
         month: Month (1-12)
         symbol: 'ES' or 'NQ'
+        now_iso: created_at/updated_at stamp (defaults to now)
 
     Returns:
         Dict with session data or None if data missing
@@ -466,11 +676,9 @@ def calculate_monthly_session(
             if attempts == 0:
                 print(f"  [INFO] No candle at {current_to_time.strftime('%Y-%m-%d')} for {year}-{month:02d} {symbol} - checking next week (holiday/data gap)")
 
-            # Add 1 week preserving wall-clock time (18:00)
-            current_naive = datetime(current_to_time.year, current_to_time.month, current_to_time.day,
-                                   current_to_time.hour, current_to_time.minute, current_to_time.second)
-            next_week_naive = current_naive + timedelta(weeks=1)
-            current_to_time = ET.localize(next_week_naive, is_dst=None)
+            # Add 1 week preserving wall-clock time (18:00); zoneinfo
+            # re-resolves the UTC offset if DST changed in between
+            current_to_time += timedelta(weeks=1)
             attempts += 1
         else:
             # Found candle - use this as TO time
@@ -488,25 +696,24 @@ def calculate_monthly_session(
     # End of first full week is the Saturday 16:59:59 before the second full week Sunday
     end_of_first_week = to_time - timedelta(hours=1, seconds=1)
 
-    # Get PoC window candles
-    poc_candles = get_ohlc_candles(conn, symbol, session_start, end_of_first_week)
-    if not poc_candles:
+    # Get PoC window extremes
+    extremes = get_window_extremes(conn, symbol, session_start, end_of_first_week)
+    if extremes is None:
         print(f"  [WARN] No PoC candles found for {year}-{month:02d} Monthly {symbol}")
         return None
 
     # Calculate PoC and RPP
-    poc, rpp = calculate_poc_and_rpp(poc_candles, to_price)
+    poc, rpp = calculate_poc_and_rpp(*extremes, to_price)
 
     # Create session record
-    now = datetime.now(ET).isoformat()
-
-    # Get month name (e.g., "January", "February", etc.)
-    month_name = datetime(year, month, 1).strftime('%B')
+    now = now_iso or datetime.now(ET).isoformat()
 
     session = {
         'symbol': symbol,
         'session_type': 'Monthly',
-        'session_name': f'{month_name} {year}',  # e.g., "January 2019"
+        'session_name': monthly_session_name(year, month),  # e.g., "January 2019"
+        'period_year': year,
+        'period_month': month,
         'session_start_time': session_start.isoformat(),
         'to_time': to_time.isoformat(),
         'true_open': to_price,
@@ -521,39 +728,83 @@ def calculate_monthly_session(
     return session
 
 
-def insert_session(conn: sqlite3.Connection, session: Dict) -> bool:
+INSERT_SESSION_SQL = """
+    INSERT OR IGNORE INTO sessions (
+        symbol, session_type, session_name,
+        period_year, period_month,
+        session_start_time, to_time,
+        true_open, poc, rpp,
+        status, expires_at,
+        created_at, updated_at
+    ) VALUES (
+        :symbol, :session_type, :session_name,
+        :period_year, :period_month,
+        :session_start_time, :to_time,
+        :true_open, :poc, :rpp,
+        :status, :expires_at,
+        :created_at, :updated_at
+    )
+"""
+
+
+def insert_sessions(conn: sqlite3.Connection, sessions: List[Dict]) -> Tuple[int, int]:
     """
-    Insert a session into the database.
+    Insert sessions into the database with a single executemany.
+
+    Duplicates are skipped by the UNIQUE constraint (INSERT OR IGNORE)
+    instead of raising, so one existing row doesn't abort the batch.
+    Runs inside the caller's transaction.
 
     Args:
         conn: Database connection
-        session: Session dictionary
+        sessions: Session dictionaries
 
     Returns:
-        bool: True if inserted, False if duplicate
+        Tuple of (inserted, skipped) counts
     """
-    cursor = conn.cursor()
+    if not sessions:
+        return 0, 0
 
-    try:
-        cursor.execute("""
-            INSERT INTO sessions (
-                symbol, session_type, session_name,
-                session_start_time, to_time,
-                true_open, poc, rpp,
-                status, expires_at,
-                created_at, updated_at
-            ) VALUES (
-                :symbol, :session_type, :session_name,
-                :session_start_time, :to_time,
-                :true_open, :poc, :rpp,
-                :status, :expires_at,
-                :created_at, :updated_at
-            )
-        """, session)
-        return True
-    except sqlite3.IntegrityError:
-        # Duplicate - already exists
-        return False
+    cursor = conn.executemany(INSERT_SESSION_SQL, sessions)
+
+    inserted = cursor.rowcount
+    if inserted:
+        invalidate_affected_sessions_cache()
+
+    return inserted, len(sessions) - inserted
+
+
+def flush_sessions(conn: sqlite3.Connection, sessions: List[Dict], kind: str, stats: Dict):
+    """
+    Write buffered sessions with insert_sessions().
+
+    Args:
+        conn: Database connection
+        sessions: Session dictionaries (emptied on return)
+        kind: Stats prefix ('yearly' or 'monthly')
+        stats: Counters; '<kind>_inserted' / '<kind>_skipped' are updated
+    """
+    inserted, skipped = insert_sessions(conn, sessions)
+    stats[f'{kind}_inserted'] += inserted
+    stats[f'{kind}_skipped'] += skipped
+
+    sessions.clear()
+
+
+# Only writes when a value changed at 2 decimal places, so the comparison
+# happens in SQLite and no SELECT of the old values is needed
+# (IS NOT: a NULL stored value counts as changed)
+UPDATE_SESSION_RANGES_SQL = """
+    UPDATE sessions
+    SET true_open = :true_open,
+        poc = :poc,
+        rpp = :rpp,
+        updated_at = :now
+    WHERE id = :id
+    AND (ROUND(true_open, 2) IS NOT ROUND(:true_open, 2)
+         OR ROUND(poc, 2) IS NOT ROUND(:poc, 2)
+         OR ROUND(rpp, 2) IS NOT ROUND(:rpp, 2))
+"""
 
 
 def update_session_ranges(
@@ -561,7 +812,8 @@ def update_session_ranges(
     session_id: int,
     true_open: float,
     poc: float,
-    rpp: float
+    rpp: float,
+    now_iso: Optional[str] = None
 ) -> bool:
     """
     Update PoC/TO/RPP ranges for an existing session.
@@ -572,57 +824,188 @@ def update_session_ranges(
         true_open: New true open value
         poc: New PoC value
         rpp: New RPP value
+        now_iso: updated_at stamp (defaults to now)
 
     Returns:
-        bool: True if updated, False if no changes
+        bool: True if updated, False if no changes (or no such session)
     """
-    cursor = conn.cursor()
-    now = datetime.now(ET).isoformat()
+    now = now_iso or datetime.now(ET).isoformat()
+
+    cursor = conn.execute(UPDATE_SESSION_RANGES_SQL, {
+        'id': session_id, 'true_open': true_open, 'poc': poc, 'rpp': rpp, 'now': now
+    })
+
+    return cursor.rowcount > 0
+
+
+def bulk_update_session_ranges(conn: sqlite3.Connection, updates: List[Dict]) -> int:
+    """
+    Update PoC/TO/RPP ranges for many sessions with a single executemany.
 
-    # Check if values actually changed
-    cursor.execute("""
-        SELECT true_open, poc, rpp
-        FROM sessions
-        WHERE id = ?
-    """, (session_id,))
+    Runs in the caller's transaction; rows whose ranges are unchanged at
+    2 decimal places are left untouched (see UPDATE_SESSION_RANGES_SQL).
 
-    result = cursor.fetchone()
-    if not result:
-        return False
+    Args:
+        conn: Database connection
+        updates: {'id', 'true_open', 'poc', 'rpp', 'now'} dicts
 
-    old_to, old_poc, old_rpp = result
+    Returns:
+        Number of sessions updated
+    """
+    if not updates:
+        return 0
 
-    # Round to 2 decimal places for comparison
-    if (round(old_to, 2) == round(true_open, 2) and
-        round(old_poc, 2) == round(poc, 2) and
-        round(old_rpp, 2) == round(rpp, 2)):
-        # No changes
-        return False
+    cursor = conn.executemany(UPDATE_SESSION_RANGES_SQL, updates)
 
-    # Update ranges
-    cursor.execute("""
-        UPDATE sessions
-        SET true_open = ?,
-            poc = ?,
-            rpp = ?,
-            updated_at = ?
-        WHERE id = ?
-    """, (true_open, poc, rpp, now, session_id))
+    return cursor.rowcount
 
-    return True
 
+def session_ranges_changed(session_row, new_session: Dict) -> bool:
+    """
+    True if a recalculated session's TO/PoC/RPP differ from the stored row.
+
+    Compares at 2 decimal places like UPDATE_SESSION_RANGES_SQL; a missing
+    stored value counts as changed.
 
-def process_full(conn: sqlite3.Connection, symbols: List[str]) -> Dict:
+    Args:
+        session_row: Stored session (SessionRow from find_affected_sessions)
+        new_session: Recalculated session dict
+    """
+    for old, new in ((session_row.true_open, new_session['true_open']),
+                     (session_row.poc, new_session['poc']),
+                     (session_row.rpp, new_session['rpp'])):
+        if old is None or round(old, 2) != round(new, 2):
+            return True
+    return False
+
+
+def check_candle_query_plans(conn: sqlite3.Connection, symbol: str) -> bool:
+    """
+    Print the EXPLAIN QUERY PLAN of each ohlc_4h query.
+
+    Args:
+        conn: Database connection
+        symbol: Symbol to bind
+
+    Returns:
+        bool: True if every query searches an index (no full ohlc_4h scan)
+    """
+    start = to_epoch(datetime(2020, 1, 1, tzinfo=ET))
+    end = to_epoch(datetime(2020, 2, 1, tzinfo=ET))
+    checks = [
+        ('QUERY_4H_SYMBOL', QUERY_4H_SYMBOL, (symbol,)),
+        ('QUERY_4H_RANGE', QUERY_4H_RANGE, (symbol, start, end)),
+        ('QUERY_4H_EXTREMES', QUERY_4H_EXTREMES, (symbol, start, end)),
+        ('QUERY_4H_COUNT', QUERY_4H_COUNT, (symbol, start, end)),
+        ('QUERY_4H_AT', QUERY_4H_AT, (symbol, start)),
+    ]
+
+    all_ok = True
+    for name, sql, params in checks:
+        plan = [row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params)]
+        ok = all(not detail.startswith('SCAN ohlc_4h') for detail in plan)
+        print(f"[{'OK' if ok else 'FAIL'}] {name}")
+        for detail in plan:
+            print(f"    {detail}")
+        all_ok = all_ok and ok
+
+    return all_ok
+
+
+def calculate_symbol_sessions(
+    conn: Optional[sqlite3.Connection],
+    symbol: str,
+    first_month: int,
+    last_month: int,
+    existing: frozenset = frozenset(),
+    now_iso: Optional[str] = None
+) -> Dict:
+    """
+    Calculate every Yearly and Monthly session for one symbol without writing.
+
+    Args:
+        conn: Database connection, or None to open a read-only one (worker
+            processes under process_full with workers > 1)
+        symbol: 'ES' or 'NQ'
+        first_month: First month index to calculate (year * 12 + month - 1)
+        last_month: Last month index to calculate (inclusive)
+        existing: (symbol, session_type, session_name) keys already in the
+            sessions table; those periods are skipped without calculating
+        now_iso: created_at/updated_at stamp for every session (defaults to now)
+
+    Returns:
+        {'symbol', 'yearly', 'monthly', 'yearly_skipped', 'monthly_skipped'}
+        with the calculated session dicts in period order
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = configure_connection(sqlite3.connect(DB_PATH, cached_statements=STATEMENT_CACHE_SIZE))
+        conn.execute("PRAGMA query_only = ON")
+
+    try:
+        result = {'symbol': symbol, 'yearly': [], 'monthly': [],
+                  'yearly_skipped': 0, 'monthly_skipped': 0}
+
+        years = []
+        for year in range(first_month // 12, last_month // 12 + 1):
+            if (symbol, 'Yearly', yearly_session_name(year)) in existing:
+                result['yearly_skipped'] += 1
+            else:
+                years.append(year)
+
+        # Enumerate (year, month) directly from the data range; months before
+        # the first candle have no data and would only be skipped
+        months = []
+        for month_index in range(first_month, last_month + 1):
+            year, month = divmod(month_index, 12)
+            if (symbol, 'Monthly', monthly_session_name(year, month + 1)) in existing:
+                result['monthly_skipped'] += 1
+            else:
+                months.append((year, month + 1))
+
+        # Nothing to calculate on a re-run over an up-to-date table
+        if (years or months) and symbol not in _symbol_caches:
+            load_symbol_caches(conn, [symbol])
+
+        for year in years:
+            session = calculate_yearly_session(conn, year, symbol, now_iso)
+            if session:
+                result['yearly'].append(session)
+            else:
+                result['yearly_skipped'] += 1
+
+        for year, month in months:
+            session = calculate_monthly_session(conn, year, month, symbol, now_iso)
+            if session:
+                result['monthly'].append(session)
+            else:
+                result['monthly_skipped'] += 1
+
+        return result
+
+    finally:
+        if own_conn:
+            conn.close()
+
+
+def process_full(conn: sqlite3.Connection, symbols: List[str], workers: int = 1,
+                 verbose: bool = False) -> Dict:
     """
     Full processing mode: Calculate all sessions from scratch.
 
     Args:
         conn: Database connection
         symbols: List of symbols to process
+        workers: Worker processes for calculating symbols in parallel
+            (1 = calculate in this process on conn)
+        verbose: Print every session's TO/PoC/RPP instead of one line
+            per (symbol, year)
 
     Returns:
         Dictionary with processing statistics
     """
+    invalidate_4h_caches()
+
     cursor = conn.cursor()
     stats = {
         'yearly_inserted': 0,
@@ -642,64 +1025,82 @@ def process_full(conn: sqlite3.Connection, symbols: List[str]) -> Dict:
     min_date = datetime.fromisoformat(min_time)
     max_date = datetime.fromisoformat(max_time)
 
-    start_year = min_date.year
-    end_year = max_date.year
-
-    # ========================================================================
-    # Calculate Yearly Sessions
-    # ========================================================================
-    print("YEARLY SESSIONS")
-    print("-" * 80)
+    first_month = min_date.year * 12 + min_date.month - 1
+    last_month = max_date.year * 12 + max_date.month - 1
+    count = len(symbols)
+
+    # Sessions already stored are skipped before any calculation (a re-run
+    # otherwise recalculates everything only for INSERT OR IGNORE to drop it)
+    cursor.execute("SELECT symbol, session_type, session_name FROM sessions")
+    existing = frozenset(cursor.fetchall())
+
+    # One created_at/updated_at stamp for the whole run
+    now_iso = datetime.now(ET).isoformat()
+
+    # Symbols are independent, so they can be calculated in parallel; the
+    # writes below stay on this connection. Process startup costs more than
+    # a symbol's calculation on a decade of 4H data, hence opt-in.
+    if workers > 1 and count > 1:
+        # spawn: workers must not inherit this connection's open transaction
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, count),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        results = executor.map(calculate_symbol_sessions, [None] * count, symbols,
+                               [first_month] * count, [last_month] * count, [existing] * count,
+                               [now_iso] * count)
+    else:
+        executor = None
+        results = map(calculate_symbol_sessions, [conn] * count, symbols,
+                      [first_month] * count, [last_month] * count, [existing] * count,
+                      [now_iso] * count)
 
-    for year in range(start_year, end_year + 1):
-        for symbol in symbols:
-            session = calculate_yearly_session(conn, year, symbol)
+    # Sessions are buffered and written with one executemany per type;
+    # duplicates of existing rows are counted as skipped by flush_sessions
+    yearly = []
+    monthly = []
 
-            if session:
-                inserted = insert_session(conn, session)
-                if inserted:
-                    stats['yearly_inserted'] += 1
-                    print(f"[+] {year} Yearly {symbol}: TO={session['true_open']:.2f}, "
+    try:
+        for result in results:
+            symbol = result['symbol']
+            print(f"{symbol}:")
+            print("-" * 80)
+
+            if verbose:
+                for session in result['yearly']:
+                    print(f"[=] {session['period_year']} Yearly {symbol}: "
+                          f"TO={session['true_open']:.2f}, "
+                          f"PoC={session['poc']:.2f}, RPP={session['rpp']:.2f}")
+                for session in result['monthly']:
+                    print(f"[=] {session['period_year']}-{session['period_month']:02d} Monthly {symbol}: "
+                          f"TO={session['true_open']:.2f}, "
                           f"PoC={session['poc']:.2f}, RPP={session['rpp']:.2f}")
-                else:
-                    stats['yearly_skipped'] += 1
-                    print(f"[SKIP] {year} Yearly {symbol}: Already exists")
             else:
-                stats['yearly_skipped'] += 1
+                per_year = {}
+                for session in result['yearly'] + result['monthly']:
+                    counts = per_year.setdefault(session['period_year'], [0, 0])
+                    counts[session['period_month'] is not None] += 1
+                for year, (yearly_count, monthly_count) in sorted(per_year.items()):
+                    print(f"  {year}: {yearly_count} Yearly, {monthly_count} Monthly")
+            print()
 
-    print()
-    print(f"Yearly Sessions: {stats['yearly_inserted']} inserted, {stats['yearly_skipped']} skipped")
-    print()
+            yearly.extend(result['yearly'])
+            monthly.extend(result['monthly'])
+            stats['yearly_skipped'] += result['yearly_skipped']
+            stats['monthly_skipped'] += result['monthly_skipped']
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-    # ========================================================================
-    # Calculate Monthly Sessions
-    # ========================================================================
-    print("MONTHLY SESSIONS")
-    print("-" * 80)
-
-    for year in range(start_year, end_year + 1):
-        for month in range(1, 13):
-            # Skip months beyond our data range
-            if year == end_year and month > max_date.month:
-                break
-
-            for symbol in symbols:
-                session = calculate_monthly_session(conn, year, month, symbol)
-
-                if session:
-                    inserted = insert_session(conn, session)
-                    if inserted:
-                        stats['monthly_inserted'] += 1
-                        print(f"[+] {year}-{month:02d} Monthly {symbol}: "
-                              f"TO={session['true_open']:.2f}, "
-                              f"PoC={session['poc']:.2f}, RPP={session['rpp']:.2f}")
-                    else:
-                        stats['monthly_skipped'] += 1
-                        print(f"[SKIP] {year}-{month:02d} Monthly {symbol}: Already exists")
-                else:
-                    stats['monthly_skipped'] += 1
+    # Insert in period order, then symbol order (as when looping by period)
+    symbol_order = {symbol: i for i, symbol in enumerate(symbols)}
+    yearly.sort(key=lambda s: (s['period_year'], symbol_order[s['symbol']]))
+    monthly.sort(key=lambda s: (s['period_year'], s['period_month'], symbol_order[s['symbol']]))
 
-    print()
+    flush_sessions(conn, yearly, 'yearly', stats)
+    flush_sessions(conn, monthly, 'monthly', stats)
+
+    print(f"Yearly Sessions: {stats['yearly_inserted']} inserted, {stats['yearly_skipped']} skipped")
     print(f"Monthly Sessions: {stats['monthly_inserted']} inserted, {stats['monthly_skipped']} skipped")
     print()
 
@@ -724,10 +1125,19 @@ def process_incremental(conn: sqlite3.Connection, symbols: List[str], new_data_r
         'unchanged': 0
     }
 
+    # Only a handful of sessions are recalculated here, so they read 4H
+    # candles through SQL rather than loading every symbol into memory
+    invalidate_4h_caches()
+
+    # One updated_at/created_at stamp for the whole run
+    now_iso = datetime.now(ET).isoformat()
+
     # If no new_data_range provided, use last processed time from metadata
     if new_data_range is None:
         # Get the last week of data as a conservative range
-        data_range = get_data_range(symbols[0])
+        # (through this connection: its PRAGMAs apply and it sees the open
+        # transaction, instead of metadata_helpers opening a default one)
+        data_range = get_data_range(symbols[0], conn.cursor())
         if data_range['max_time']:
             max_time = datetime.fromisoformat(data_range['max_time'])
             start_time = max_time - timedelta(days=30)  # Last 30 days
@@ -755,67 +1165,61 @@ def process_incremental(conn: sqlite3.Connection, symbols: List[str], new_data_r
         print(f"  New session periods: {len(new_periods)}")
         print()
 
-        # Recalculate affected sessions
-        for session_dict in sessions_to_recalc:
-            session_type = session_dict['session_type']
-            session_id = session_dict['id']
+        # Recalculate affected sessions; changed ranges are written in one
+        # batch below, together with clearing the recalc flags
+        recalculated_ids = []
+        range_updates = []
+        for session_row in sessions_to_recalc:
+            session_type = session_row.session_type
+            session_id = session_row.id
 
             # Recalculate based on type
             if session_type == 'Yearly':
-                # Extract year from session name (e.g., "Year 2019")
-                year = int(session_dict['session_name'].replace('Year ', ''))
-                new_session = calculate_yearly_session(conn, year, symbol)
+                new_session = calculate_yearly_session(conn, session_row.period_year, symbol, now_iso)
             else:  # Monthly
-                # Extract year/month from session name (e.g., "January 2019")
-                parts = session_dict['session_name'].split()
-                month_name, year_str = parts[0], parts[1]
-                year = int(year_str)
-                month = datetime.strptime(month_name, '%B').month
-                new_session = calculate_monthly_session(conn, year, month, symbol)
-
-            if new_session:
-                # Update the session ranges
-                changed = update_session_ranges(
-                    conn,
-                    session_id,
-                    new_session['true_open'],
-                    new_session['poc'],
-                    new_session['rpp']
+                new_session = calculate_monthly_session(
+                    conn, session_row.period_year, session_row.period_month, symbol, now_iso
                 )
 
-                if changed:
+            if new_session:
+                if session_ranges_changed(session_row, new_session):
+                    range_updates.append({
+                        'id': session_id,
+                        'true_open': new_session['true_open'],
+                        'poc': new_session['poc'],
+                        'rpp': new_session['rpp'],
+                        'now': now_iso
+                    })
                     stats['recalculated'] += 1
-                    print(f"  [UPDATE] {session_dict['session_name']}: "
+                    print(f"  [UPDATE] {session_row.session_name}: "
                           f"TO={new_session['true_open']:.2f}, "
                           f"PoC={new_session['poc']:.2f}, RPP={new_session['rpp']:.2f}")
                 else:
                     stats['unchanged'] += 1
-                    print(f"  [OK] {session_dict['session_name']}: No changes")
+                    print(f"  [OK] {session_row.session_name}: No changes")
+
+                recalculated_ids.append(session_id)
 
-                # Clear recalc flag
-                clear_recalc_flag(conn, session_id)
+        # Update changed ranges and clear recalc flags in one batch each
+        bulk_update_session_ranges(conn, range_updates)
+        clear_recalc_flags(conn, recalculated_ids)
 
-        # Create new sessions
+        # Create new sessions (periods with no session yet), inserted in one batch
+        new_sessions = []
         for period in new_periods:
             if period['type'] == 'Yearly':
-                session = calculate_yearly_session(conn, period['year'], symbol)
-                if session:
-                    inserted = insert_session(conn, session)
-                    if inserted:
-                        stats['created'] += 1
-                        print(f"  [NEW] Year {period['year']}: "
-                              f"TO={session['true_open']:.2f}, "
-                              f"PoC={session['poc']:.2f}, RPP={session['rpp']:.2f}")
+                session = calculate_yearly_session(conn, period['year'], symbol, now_iso)
             else:  # Monthly
-                session = calculate_monthly_session(conn, period['year'], period['month'], symbol)
-                if session:
-                    inserted = insert_session(conn, session)
-                    if inserted:
-                        stats['created'] += 1
-                        month_name = datetime(period['year'], period['month'], 1).strftime('%B')
-                        print(f"  [NEW] {month_name} {period['year']}: "
-                              f"TO={session['true_open']:.2f}, "
-                              f"PoC={session['poc']:.2f}, RPP={session['rpp']:.2f}")
+                session = calculate_monthly_session(conn, period['year'], period['month'], symbol, now_iso)
+
+            if session:
+                new_sessions.append(session)
+                print(f"  [NEW] {session['session_name']}: "
+                      f"TO={session['true_open']:.2f}, "
+                      f"PoC={session['poc']:.2f}, RPP={session['rpp']:.2f}")
+
+        created, _ = insert_sessions(conn, new_sessions)
+        stats['created'] += created
 
         print()
 
@@ -846,6 +1250,12 @@ Examples:
                         help='Incremental mode: Only recalculate affected sessions')
     parser.add_argument('--symbol', type=str,
                         help='Process only this symbol (ES or NQ)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Full mode: calculate symbols in this many worker processes (default: 1)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Full mode: print every calculated session')
+    parser.add_argument('--check-plans', action='store_true',
+                        help='Print ohlc_4h query plans and exit (non-zero on a table scan)')
 
     args = parser.parse_args()
 
@@ -861,48 +1271,41 @@ Examples:
     print()
 
     # Connect to database
-    conn = sqlite3.connect(DB_PATH)
+    conn = configure_connection(sqlite3.connect(DB_PATH, cached_statements=STATEMENT_CACHE_SIZE))
+
+    if args.check_plans:
+        plans_ok = all([check_candle_query_plans(conn, symbol) for symbol in symbols])
+        conn.close()
+        raise SystemExit(0 if plans_ok else 1)
 
     try:
+        # One write transaction for every session insert/update and the
+        # metadata rows; committed once below, rolled back on any error.
+        # IMMEDIATE takes the write lock up front instead of on first INSERT.
+        conn.execute("BEGIN IMMEDIATE")
+
         if args.full:
             print("MODE: Full Processing")
             print()
-            stats = process_full(conn, symbols)
-
-            # Update metadata
-            cursor = conn.cursor()
-            for symbol in symbols:
-                data_range = get_data_range(symbol, cursor)
-                if data_range['max_time']:
-                    update_processing_metadata(
-                        symbol=symbol,
-                        process_type='session_calc',
-                        last_time=data_range['max_time'],
-                        records_count=stats['yearly_inserted'] + stats['monthly_inserted'],
-                        status='success',
-                        cursor=cursor,
-                        commit=False
-                    )
+            stats = process_full(conn, symbols, args.workers, args.verbose)
+
+            records_count = stats['yearly_inserted'] + stats['monthly_inserted']
 
         else:  # Incremental
             print("MODE: Incremental Processing")
             print()
             stats = process_incremental(conn, symbols)
 
-            # Update metadata
-            cursor = conn.cursor()
-            for symbol in symbols:
-                data_range = get_data_range(symbol, cursor)
-                if data_range['max_time']:
-                    update_processing_metadata(
-                        symbol=symbol,
-                        process_type='session_calc',
-                        last_time=data_range['max_time'],
-                        records_count=stats['recalculated'] + stats['created'],
-                        status='success',
-                        cursor=cursor,
-                        commit=False
-                    )
+            records_count = stats['recalculated'] + stats['created']
+
+        # Update metadata for every symbol in one batch
+        cursor = conn.cursor()
+        metadata_rows = [
+            (symbol, data_range['max_time'], records_count)
+            for symbol, data_range in get_data_ranges(symbols, cursor).items()
+            if data_range['max_time']
+        ]
+        update_processing_metadata_many(metadata_rows, 'session_calc', cursor=cursor, commit=False)
 
         # Commit changes
         conn.commit()
@@ -2,20 +2,46 @@
 """Quick check of current 1M data in database."""
 import sqlite3
 
-conn = sqlite3.connect('data/ohlc_data.db')
-cursor = conn.cursor()
+from db_utils import open_ro
 
-print("Current 1M Data:")
-print("-" * 80)
+DB_PATH = 'data/ohlc_data.db'
 
-cursor.execute("""
-    SELECT symbol, MIN(time) as first_candle, MAX(time) as last_candle, COUNT(*) as total_candles
-    FROM ohlc_1m
-    GROUP BY symbol
-""")
 
-for row in cursor.fetchall():
-    symbol, first, last, count = row
-    print(f"{symbol:>6}: {first} to {last} ({count:,} candles)")
+def report(conn: sqlite3.Connection) -> bool:
+    """
+    Print the first/last 1M candle and candle count per symbol.
 
-conn.close()
+    Returns:
+        True (the report has no failure case)
+    """
+    cursor = conn.cursor()
+
+    print("Current 1M Data:")
+    print("-" * 80)
+
+    cursor.execute("""
+        SELECT symbol, MIN(time) as first_candle, MAX(time) as last_candle, COUNT(*) as total_candles
+        FROM ohlc_1m
+        GROUP BY symbol
+    """)
+
+    for row in cursor:
+        symbol, first, last, count = row
+        print(f"{symbol:>6}: {first} to {last} ({count:,} candles)")
+
+    return True
+
+
+def main():
+    conn = open_ro(DB_PATH)
+    try:
+        ok = report(conn)
+    finally:
+        conn.close()
+
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
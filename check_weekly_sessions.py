@@ -2,47 +2,77 @@
 """Check corrected weekly sessions."""
 import sqlite3
 
-conn = sqlite3.connect('data/ohlc_data.db')
-cursor = conn.cursor()
-
-cursor.execute("""
-    SELECT symbol, session_name, session_start_time, to_time, true_open, poc, rpp
-    FROM sessions
-    WHERE session_type = 'Weekly'
-    ORDER BY symbol, to_time
-""")
-
-print("=" * 120)
-print("Weekly Sessions (CORRECTED)")
-print("=" * 120)
-print(f"{'Symbol':<6} {'Session Name':<22} {'Start Time':<20} {'TO Time':<20} {'TO':>10} {'PoC':>10} {'RPP':>10}")
-print("-" * 120)
-
-for row in cursor.fetchall():
-    symbol, name, start, to, to_price, poc, rpp = row
-    print(f"{symbol:<6} {name:<22} {start[:19]:<20} {to[:19]:<20} {to_price:>10.2f} {poc:>10.2f} {rpp:>10.2f}")
-
-print("=" * 120)
-
-# Verify the TO times are Monday 18:00
-print()
-print("Verification: TO times should all be Monday 18:00")
-print("-" * 120)
-
-cursor.execute("""
-    SELECT symbol, session_name, to_time
-    FROM sessions
-    WHERE session_type = 'Weekly'
-    ORDER BY symbol, to_time
-""")
-
-for row in cursor.fetchall():
-    symbol, name, to = row
-    from datetime import datetime
-    to_dt = datetime.fromisoformat(to)
-    day_name = to_dt.strftime("%A")
-    time_str = to_dt.strftime("%H:%M")
-    status = "OK" if day_name == "Monday" and time_str == "18:00" else "ERROR"
-    print(f"  {symbol} {name:<22} {to[:19]} ({day_name} {time_str}) [{status}]")
-
-conn.close()
+from db_utils import open_ro
+
+DB_PATH = 'data/ohlc_data.db'
+
+# Indexed by SQLite's strftime('%w') (0 = Sunday)
+DAY_NAMES = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+
+
+def report(conn: sqlite3.Connection) -> bool:
+    """
+    Print the Weekly sessions and verify each TO is Monday 18:00.
+
+    Returns:
+        True (the report has no failure case)
+    """
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT symbol, session_name, session_start_time, to_time, true_open, poc, rpp
+        FROM sessions
+        WHERE session_type = 'Weekly'
+        ORDER BY symbol, to_time
+    """)
+
+    print("=" * 120)
+    print("Weekly Sessions (CORRECTED)")
+    print("=" * 120)
+    print(f"{'Symbol':<6} {'Session Name':<22} {'Start Time':<20} {'TO Time':<20} {'TO':>10} {'PoC':>10} {'RPP':>10}")
+    print("-" * 120)
+
+    for row in cursor:
+        symbol, name, start, to, to_price, poc, rpp = row
+        print(f"{symbol:<6} {name:<22} {start[:19]:<20} {to[:19]:<20} {to_price:>10.2f} {poc:>10.2f} {rpp:>10.2f}")
+
+    print("=" * 120)
+
+    # Verify the TO times are Monday 18:00
+    print()
+    print("Verification: TO times should all be Monday 18:00")
+    print("-" * 120)
+
+    # Day of week and HH:MM come from SQLite; substr() keeps the local wall-clock
+    # part of to_time (strftime on the full string would convert it to UTC first)
+    cursor.execute("""
+        SELECT symbol, session_name, to_time,
+               CAST(strftime('%w', substr(to_time, 1, 19)) AS INTEGER) as weekday,
+               strftime('%H:%M', substr(to_time, 1, 19)) as time_str
+        FROM sessions
+        WHERE session_type = 'Weekly'
+        ORDER BY symbol, to_time
+    """)
+
+    for row in cursor:
+        symbol, name, to, weekday, time_str = row
+        day_name = DAY_NAMES[weekday]
+        status = "OK" if day_name == "Monday" and time_str == "18:00" else "ERROR"
+        print(f"  {symbol} {name:<22} {to[:19]} ({day_name} {time_str}) [{status}]")
+
+    return True
+
+
+def main():
+    conn = open_ro(DB_PATH)
+    try:
+        ok = report(conn)
+    finally:
+        conn.close()
+
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -35,13 +35,14 @@ CREATE TABLE ohlc_1m (
     low REAL NOT NULL,
     close REAL NOT NULL,
     volume INTEGER,
+    time_ns INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', time) AS INTEGER) * 1000000000) VIRTUAL,
     UNIQUE(symbol, time)
 )
 """)
 
-cursor.execute("CREATE INDEX idx_ohlc_symbol_time ON ohlc_1m(symbol, time)")
+cursor.execute("CREATE INDEX idx_ohlc_symbol_time_ns ON ohlc_1m(symbol, time_ns)")
 print("   [OK] ohlc_1m table created")
-print("   [OK] Index: idx_ohlc_symbol_time")
+print("   [OK] Index: idx_ohlc_symbol_time_ns")
 
 # =============================================================================
 # 2. SESSIONS TABLE - Range Values & Status Tracking
@@ -131,12 +132,14 @@ CREATE TABLE poi_events (
 cursor.execute("CREATE INDEX idx_poi_events_session ON poi_events(session_id)")
 cursor.execute("CREATE INDEX idx_poi_events_trading_day ON poi_events(trading_day)")
 cursor.execute("CREATE INDEX idx_poi_events_symbol_session ON poi_events(symbol, session_name)")
+cursor.execute("CREATE INDEX idx_poi_events_session_event ON poi_events(session_name, event_type, poi_type, es_event_time, nq_event_time)")
 cursor.execute("CREATE INDEX idx_poi_events_es_time ON poi_events(es_event_time)")
 cursor.execute("CREATE INDEX idx_poi_events_nq_time ON poi_events(nq_event_time)")
 print("   [OK] poi_events table created")
 print("   [OK] Index: idx_poi_events_session")
 print("   [OK] Index: idx_poi_events_trading_day")
 print("   [OK] Index: idx_poi_events_symbol_session")
+print("   [OK] Index: idx_poi_events_session_event")
 print("   [OK] Index: idx_poi_events_es_time")
 print("   [OK] Index: idx_poi_events_nq_time")
 
@@ -174,12 +177,12 @@ CREATE TABLE swings (
 cursor.execute("CREATE INDEX idx_swings_symbol_time ON swings(symbol, swing_time)")
 cursor.execute("CREATE INDEX idx_swings_class ON swings(swing_class)")
 cursor.execute("CREATE INDEX idx_swings_major ON swings(swing_class) WHERE swing_class >= 3")
-cursor.execute("CREATE INDEX idx_swings_poi_link ON swings(nearest_poi_event_id)")
+cursor.execute("CREATE INDEX idx_swings_poi_time ON swings(nearest_poi_event_id, swing_time)")
 print("   [OK] swings table created")
 print("   [OK] Index: idx_swings_symbol_time")
 print("   [OK] Index: idx_swings_class")
 print("   [OK] Index: idx_swings_major (partial)")
-print("   [OK] Index: idx_swings_poi_link")
+print("   [OK] Index: idx_swings_poi_time")
 
 # =============================================================================
 # 5. INSIGHTS TABLE - Research Journal
@@ -46,11 +46,12 @@ def create_database():
             high REAL NOT NULL,
             low REAL NOT NULL,
             close REAL NOT NULL,
+            time_epoch INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', time) AS INTEGER)) VIRTUAL,
             UNIQUE(symbol, time)
         );
     """)
 
-    cursor.execute("CREATE INDEX idx_ohlc_symbol_time ON ohlc_4h(symbol, time);")
+    cursor.execute("CREATE INDEX idx_ohlc_symbol_time_epoch ON ohlc_4h(symbol, time_epoch);")
 
     # -------------------------------------------------------------------------
     # TABLE 2: sessions (tracks Yearly and Monthly sessions only)
@@ -62,6 +63,8 @@ def create_database():
             symbol TEXT NOT NULL,
             session_type TEXT NOT NULL,  -- 'Yearly', 'Monthly'
             session_name TEXT NOT NULL,  -- 'Yearly', 'Monthly'
+            period_year INTEGER,  -- e.g., 2019
+            period_month INTEGER,  -- 1-12 for Monthly, NULL for Yearly
 
             -- Time boundaries
             session_start_time TEXT NOT NULL,  -- ISO timestamp when session begins
@@ -96,6 +99,12 @@ def create_database():
     cursor.execute("CREATE INDEX idx_sessions_active ON sessions(symbol, status) WHERE status != 'resolved';")
     cursor.execute("CREATE INDEX idx_sessions_unexpired ON sessions(symbol, expires_at) WHERE expires_at IS NULL OR expires_at > datetime('now');")
 
+    # Indexes for affected-session detection (see affected_sessions.py)
+    cursor.execute("CREATE INDEX idx_sessions_sym_start_to ON sessions(symbol, session_start_time, to_time) WHERE true_open IS NOT NULL;")
+    cursor.execute("CREATE INDEX idx_sessions_incomplete ON sessions(symbol) WHERE true_open IS NULL;")
+    cursor.execute("CREATE INDEX idx_sessions_sym_status_to ON sessions(symbol, status, to_time);")
+    cursor.execute("CREATE INDEX idx_sessions_period ON sessions(symbol, session_type, period_year, period_month);")
+
     # -------------------------------------------------------------------------
     # TABLE 3: poi_events
     # -------------------------------------------------------------------------
@@ -137,7 +146,7 @@ def create_database():
     cursor.execute("CREATE INDEX idx_poi_events_es_session ON poi_events(es_session_id);")
     cursor.execute("CREATE INDEX idx_poi_events_nq_session ON poi_events(nq_session_id);")
     cursor.execute("CREATE INDEX idx_poi_events_trading_day ON poi_events(trading_day);")
-    cursor.execute("CREATE INDEX idx_poi_events_session_name ON poi_events(session_name);")
+    cursor.execute("CREATE INDEX idx_poi_events_session_event ON poi_events(session_name, event_type, poi_type, es_event_time, nq_event_time);")
     cursor.execute("CREATE INDEX idx_poi_events_es_time ON poi_events(es_event_time);")
     cursor.execute("CREATE INDEX idx_poi_events_nq_time ON poi_events(nq_event_time);")
 
@@ -174,7 +183,7 @@ def create_database():
     cursor.execute("CREATE INDEX idx_swings_symbol_time ON swings(symbol, swing_time);")
     cursor.execute("CREATE INDEX idx_swings_class ON swings(swing_class);")
     cursor.execute("CREATE INDEX idx_swings_major ON swings(swing_class) WHERE swing_class >= 3;")
-    cursor.execute("CREATE INDEX idx_swings_poi_link ON swings(nearest_poi_event_id);")
+    cursor.execute("CREATE INDEX idx_swings_poi_time ON swings(nearest_poi_event_id, swing_time);")
 
     # -------------------------------------------------------------------------
     # TABLE 5: insights
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Shared SQLite connection helpers for the read-only check/report scripts.
+
+- open_ro(): Open a database read-only with read-tuned PRAGMAs and
+  sqlite3.Row results
+"""
+
+import sqlite3
+
+DB_PATH = 'data/ohlc_data.db'
+
+
+def open_ro(path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    Open a SQLite database read-only for reporting queries.
+
+    The connection uses a mode=ro URI, so a check script can never write
+    (and can't switch the journal mode either: WAL is set by the writers,
+    see affected_sessions.configure_connection(), and read-only connections
+    then run alongside a writer without blocking it).
+
+    - cache_size=-200000: up to ~200MB page cache for repeated aggregates
+    - temp_store=MEMORY: GROUP BY / ORDER BY temp B-trees stay in RAM
+    - mmap_size=256MB: reads come straight from the page cache mapping
+
+    Args:
+        path: Database file path (default: data/ohlc_data.db)
+
+    Returns:
+        sqlite3.Connection with row_factory = sqlite3.Row
+    """
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    conn.execute("PRAGMA cache_size = -200000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.row_factory = sqlite3.Row
+    return conn
@@ -14,10 +14,22 @@ Process Types:
 
 import sqlite3
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 DB_PATH = 'data/yearly_monthly.db'
 
+UPSERT_METADATA_SQL = """
+    INSERT INTO processing_metadata
+    (symbol, process_type, last_processed_time, records_processed, status, error_message, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(symbol, process_type) DO UPDATE SET
+        last_processed_time = excluded.last_processed_time,
+        records_processed = excluded.records_processed,
+        status = excluded.status,
+        error_message = excluded.error_message,
+        updated_at = excluded.updated_at
+"""
+
 
 def get_last_processed_time(symbol: str, process_type: str, cursor: sqlite3.Cursor = None) -> Optional[str]:
     """
@@ -83,17 +95,50 @@ def update_processing_metadata(
 
     try:
         now = datetime.now().isoformat()
-        cursor.execute("""
-            INSERT INTO processing_metadata
-            (symbol, process_type, last_processed_time, records_processed, status, error_message, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(symbol, process_type) DO UPDATE SET
-                last_processed_time = excluded.last_processed_time,
-                records_processed = excluded.records_processed,
-                status = excluded.status,
-                error_message = excluded.error_message,
-                updated_at = excluded.updated_at
-        """, (symbol, process_type, last_time, records_count, status, error_message, now, now))
+        cursor.execute(UPSERT_METADATA_SQL,
+                       (symbol, process_type, last_time, records_count, status, error_message, now, now))
+
+        if commit and should_close:
+            conn.commit()
+
+    finally:
+        if should_close:
+            cursor.close()
+            conn.close()
+
+
+def update_processing_metadata_many(
+    rows: List[Tuple[str, str, int]],
+    process_type: str,
+    status: str = 'success',
+    cursor: sqlite3.Cursor = None,
+    commit: bool = True
+) -> None:
+    """
+    Update or insert processing metadata for several symbols in one executemany.
+
+    Args:
+        rows: (symbol, last_time, records_count) tuples
+        process_type: Type of processing ('ohlc_load', 'session_calc', 'poi_processing', 'swing_detection')
+        status: Processing status shared by every row ('success' or 'error')
+        cursor: Optional database cursor (if None, creates own connection)
+        commit: Whether to commit the transaction (default True)
+    """
+    if not rows:
+        return
+
+    should_close = False
+    if cursor is None:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        should_close = True
+
+    try:
+        now = datetime.now().isoformat()
+        cursor.executemany(UPSERT_METADATA_SQL, [
+            (symbol, process_type, last_time, records_count, status, None, now, now)
+            for symbol, last_time, records_count in rows
+        ])
 
         if commit and should_close:
             conn.commit()
@@ -226,6 +271,50 @@ def get_data_range(symbol: str, cursor: sqlite3.Cursor = None) -> Dict[str, Any]
             conn.close()
 
 
+def get_data_ranges(symbols: List[str], cursor: sqlite3.Cursor = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get get_data_range() information for several symbols with one grouped query.
+
+    Args:
+        symbols: Symbol names (e.g., ['ES', 'NQ'])
+        cursor: Optional database cursor (if None, creates own connection)
+
+    Returns:
+        {symbol: {'min_time', 'max_time', 'total_candles'}} for every requested
+        symbol (None/None/0 for symbols without data)
+    """
+    ranges = {symbol: {'min_time': None, 'max_time': None, 'total_candles': 0} for symbol in symbols}
+    if not symbols:
+        return ranges
+
+    should_close = False
+    if cursor is None:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        should_close = True
+
+    try:
+        query = f"""
+            SELECT symbol, MIN(time), MAX(time), COUNT(*)
+            FROM ohlc_4h
+            WHERE symbol IN ({','.join('?' * len(symbols))})
+            GROUP BY symbol
+        """
+        for symbol, min_time, max_time, total_candles in cursor.execute(query, list(symbols)):
+            ranges[symbol] = {
+                'min_time': min_time,
+                'max_time': max_time,
+                'total_candles': total_candles
+            }
+
+        return ranges
+
+    finally:
+        if should_close:
+            cursor.close()
+            conn.close()
+
+
 def get_processing_status(symbol: str = None, cursor: sqlite3.Cursor = None) -> list:
     """
     Get processing status for all process types, optionally filtered by symbol.
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Add an integer epoch-second time column to ohlc_4h.
+
+- time_epoch: VIRTUAL generated column computed from the ISO `time` text, so
+  load_4h_csv.py keeps inserting `time` only and never writes it directly
+- idx_ohlc_symbol_time_epoch: (symbol, time_epoch) index backing the candle
+  range and point lookups in calculate_yearly_monthly_sessions.py (integer
+  compares instead of ISO string compares, and correct ordering across DST)
+- idx_ohlc_symbol_time is dropped: UNIQUE(symbol, time) already provides the
+  same (symbol, time) index
+
+This migration is SAFE to run multiple times (checks column/index first).
+
+Usage:
+    python migrate_add_ohlc_time_epoch_4h.py
+"""
+
+import sqlite3
+
+DB_PATH = 'data/yearly_monthly.db'
+
+TIME_EPOCH_DDL = (
+    "ALTER TABLE ohlc_4h ADD COLUMN time_epoch INTEGER "
+    "GENERATED ALWAYS AS (CAST(strftime('%s', time) AS INTEGER)) VIRTUAL"
+)
+
+
+def migrate():
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    print("=" * 80)
+    print("MIGRATION: Add time_epoch column to ohlc_4h table")
+    print("=" * 80)
+    print()
+
+    # table_xinfo (not table_info) lists generated columns
+    cursor.execute("PRAGMA table_xinfo(ohlc_4h)")
+    columns = [row[1] for row in cursor.fetchall()]
+
+    if 'time_epoch' in columns:
+        print("[SKIP] time_epoch column already exists")
+    else:
+        print("Adding time_epoch column...")
+        cursor.execute(TIME_EPOCH_DDL)
+        print("[OK] time_epoch column added")
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='ohlc_4h'")
+    indexes = {row[0] for row in cursor.fetchall()}
+
+    if 'idx_ohlc_symbol_time_epoch' in indexes:
+        print("[SKIP] idx_ohlc_symbol_time_epoch already exists")
+    else:
+        print("Creating idx_ohlc_symbol_time_epoch...")
+        cursor.execute("CREATE INDEX idx_ohlc_symbol_time_epoch ON ohlc_4h(symbol, time_epoch)")
+        print("[OK] idx_ohlc_symbol_time_epoch created")
+
+    if 'idx_ohlc_symbol_time' in indexes:
+        print("Dropping idx_ohlc_symbol_time (duplicate of UNIQUE(symbol, time))...")
+        cursor.execute("DROP INDEX idx_ohlc_symbol_time")
+        print("[OK] idx_ohlc_symbol_time dropped")
+    else:
+        print("[SKIP] idx_ohlc_symbol_time already dropped")
+
+    print()
+    print("Running ANALYZE ohlc_4h...")
+    cursor.execute("ANALYZE ohlc_4h")
+    print("[OK] Planner statistics updated")
+
+    conn.commit()
+
+    # Verify
+    print()
+    print("Verification:")
+    print("-" * 80)
+
+    cursor.execute("""
+        SELECT COUNT(*) FROM ohlc_4h WHERE time_epoch IS NULL
+    """)
+    missing = cursor.fetchone()[0]
+    if missing:
+        print(f"[WARN] {missing} rows have an unparseable time (time_epoch is NULL)")
+    else:
+        print("[OK] time_epoch populated for every row")
+
+    print()
+    print("=" * 80)
+    print("[SUCCESS] Migration complete!")
+    print("=" * 80)
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    migrate()
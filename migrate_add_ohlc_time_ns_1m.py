@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Add an integer epoch-nanosecond time column to ohlc_1m.
+
+- time_ns: VIRTUAL generated column computed from the ISO `time` text, so
+  existing loaders keep inserting `time` only and never write it directly
+- idx_ohlc_symbol_time_ns: (symbol, time_ns) index backing the candle range
+  and point lookups in calculate_daily_sessions.py (8-byte integer compares
+  instead of ISO string compares, and correct ordering across DST fall-back)
+- idx_ohlc_symbol_time is dropped: UNIQUE(symbol, time) already provides the
+  same (symbol, time) index
+
+This migration is SAFE to run multiple times (checks column/index first).
+
+Usage:
+    python migrate_add_ohlc_time_ns_1m.py
+"""
+
+import sqlite3
+
+DB_PATH = 'data/ohlc_data.db'
+
+TIME_NS_DDL = (
+    "ALTER TABLE ohlc_1m ADD COLUMN time_ns INTEGER "
+    "GENERATED ALWAYS AS (CAST(strftime('%s', time) AS INTEGER) * 1000000000) VIRTUAL"
+)
+
+
+def migrate():
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    print("=" * 80)
+    print("MIGRATION: Add time_ns column to ohlc_1m table")
+    print("=" * 80)
+    print()
+
+    # table_xinfo (not table_info) lists generated columns
+    cursor.execute("PRAGMA table_xinfo(ohlc_1m)")
+    columns = [row[1] for row in cursor.fetchall()]
+
+    if 'time_ns' in columns:
+        print("[SKIP] time_ns column already exists")
+    else:
+        print("Adding time_ns column...")
+        cursor.execute(TIME_NS_DDL)
+        print("[OK] time_ns column added")
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='ohlc_1m'")
+    indexes = {row[0] for row in cursor.fetchall()}
+
+    if 'idx_ohlc_symbol_time_ns' in indexes:
+        print("[SKIP] idx_ohlc_symbol_time_ns already exists")
+    else:
+        print("Creating idx_ohlc_symbol_time_ns...")
+        cursor.execute("CREATE INDEX idx_ohlc_symbol_time_ns ON ohlc_1m(symbol, time_ns)")
+        print("[OK] idx_ohlc_symbol_time_ns created")
+
+    if 'idx_ohlc_symbol_time' in indexes:
+        print("Dropping idx_ohlc_symbol_time (duplicate of UNIQUE(symbol, time))...")
+        cursor.execute("DROP INDEX idx_ohlc_symbol_time")
+        print("[OK] idx_ohlc_symbol_time dropped")
+    else:
+        print("[SKIP] idx_ohlc_symbol_time already dropped")
+
+    print()
+    print("Running ANALYZE ohlc_1m...")
+    cursor.execute("ANALYZE ohlc_1m")
+    print("[OK] Planner statistics updated")
+
+    conn.commit()
+
+    # Verify
+    print()
+    print("Verification:")
+    print("-" * 80)
+
+    cursor.execute("""
+        SELECT COUNT(*) FROM ohlc_1m WHERE time_ns IS NULL
+    """)
+    missing = cursor.fetchone()[0]
+    if missing:
+        print(f"[WARN] {missing} rows have an unparseable time (time_ns is NULL)")
+    else:
+        print("[OK] time_ns populated for every row")
+
+    print()
+    print("=" * 80)
+    print("[SUCCESS] Migration complete!")
+    print("=" * 80)
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    migrate()
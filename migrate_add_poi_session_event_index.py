@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Add a covering (session_name, event_type, poi_type, es/nq_event_time) index to
+the poi_events table in ohlc_data.db.
+
+- idx_poi_events_session_event: backs the `WHERE session_name = ?` reports in
+  check_december_poi_events.py / check_december_swings.py; the per-session
+  summary (GROUP BY poi_type, event_type with COUNT(es_event_time) /
+  COUNT(nq_event_time)) is answered from the index alone, with no table
+  fetches and no temp B-tree for the GROUP BY
+- idx_poi_events_session_name (session_name) is dropped if present: it is a
+  prefix of idx_poi_events_session_event
+
+ANALYZE is run afterwards so the query planner has statistics to choose it.
+
+This migration is SAFE to run multiple times (checks indexes first).
+
+Usage:
+    python migrate_add_poi_session_event_index.py
+"""
+
+import sqlite3
+
+DB_PATH = 'data/ohlc_data.db'
+
+
+def migrate():
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    print("=" * 80)
+    print("MIGRATION: Add idx_poi_events_session_event to poi_events table")
+    print("=" * 80)
+    print()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='poi_events'")
+    indexes = {row[0] for row in cursor.fetchall()}
+
+    if 'idx_poi_events_session_event' in indexes:
+        print("[SKIP] idx_poi_events_session_event already exists")
+    else:
+        print("Creating idx_poi_events_session_event...")
+        cursor.execute("""
+            CREATE INDEX idx_poi_events_session_event
+            ON poi_events(session_name, event_type, poi_type, es_event_time, nq_event_time)
+        """)
+        print("[OK] idx_poi_events_session_event created")
+
+    if 'idx_poi_events_session_name' in indexes:
+        print("Dropping idx_poi_events_session_name (prefix of idx_poi_events_session_event)...")
+        cursor.execute("DROP INDEX idx_poi_events_session_name")
+        print("[OK] idx_poi_events_session_name dropped")
+    else:
+        print("[SKIP] idx_poi_events_session_name not present")
+
+    print()
+    print("Running ANALYZE poi_events...")
+    cursor.execute("ANALYZE poi_events")
+    print("[OK] Planner statistics updated")
+
+    conn.commit()
+
+    print()
+    print("=" * 80)
+    print("[SUCCESS] Migration complete!")
+    print("=" * 80)
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Add query-supporting indexes to the sessions table in yearly_monthly.db.
+
+These indexes back the lookups in affected_sessions.py:
+- idx_sessions_sym_start_to: PoC window overlap check (sessions with a TO)
+- idx_sessions_incomplete: Sessions still missing their TO (partial index)
+- idx_sessions_sym_status_to: Active sessions needing a POI rescan
+- idx_sessions_pending: Sessions flagged needs_recalc = 1 (partial index)
+
+ANALYZE is run afterwards so the query planner has statistics to choose them.
+
+This migration is SAFE to run multiple times (uses IF NOT EXISTS).
+
+Usage:
+    python migrate_add_session_indexes.py
+"""
+
+import sqlite3
+
+DB_PATH = 'data/yearly_monthly.db'
+
+# (index name, CREATE statement)
+SESSION_INDEXES = [
+    ('idx_sessions_sym_start_to',
+     "CREATE INDEX IF NOT EXISTS idx_sessions_sym_start_to "
+     "ON sessions(symbol, session_start_time, to_time) WHERE true_open IS NOT NULL"),
+    ('idx_sessions_incomplete',
+     "CREATE INDEX IF NOT EXISTS idx_sessions_incomplete "
+     "ON sessions(symbol) WHERE true_open IS NULL"),
+    ('idx_sessions_sym_status_to',
+     "CREATE INDEX IF NOT EXISTS idx_sessions_sym_status_to "
+     "ON sessions(symbol, status, to_time)"),
+    ('idx_sessions_pending',
+     "CREATE INDEX IF NOT EXISTS idx_sessions_pending "
+     "ON sessions(symbol, session_start_time) WHERE needs_recalc = 1"),
+]
+
+# Indexes over columns added by other migrations
+INDEX_REQUIRED_COLUMNS = {
+    'idx_sessions_pending': 'needs_recalc',  # migrate_add_processing_metadata.py
+}
+
+
+def migrate():
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    print("=" * 80)
+    print("MIGRATION: Add query indexes to sessions table")
+    print("=" * 80)
+    print()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='sessions'")
+    existing = {row[0] for row in cursor.fetchall()}
+
+    cursor.execute("PRAGMA table_info(sessions)")
+    columns = {col[1] for col in cursor.fetchall()}
+
+    for index_name, ddl in SESSION_INDEXES:
+        required = INDEX_REQUIRED_COLUMNS.get(index_name)
+        if index_name in existing:
+            print(f"[SKIP] {index_name} already exists")
+        elif required and required not in columns:
+            print(f"[SKIP] {index_name}: sessions.{required} missing "
+                  f"(run migrate_add_processing_metadata.py first)")
+        else:
+            print(f"Creating {index_name}...")
+            cursor.execute(ddl)
+            print(f"[OK] {index_name} created")
+
+    print()
+    print("Running ANALYZE sessions...")
+    cursor.execute("ANALYZE sessions")
+    print("[OK] Planner statistics updated")
+
+    conn.commit()
+
+    print()
+    print("=" * 80)
+    print("[SUCCESS] Migration complete!")
+    print("=" * 80)
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    migrate()
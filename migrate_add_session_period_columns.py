@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Add structured period columns to the sessions table in yearly_monthly.db.
+
+- period_year:  Calendar year of the session (e.g., 2019)
+- period_month: Month number 1-12 for Monthly sessions, NULL for Yearly
+
+Existing rows are backfilled from session_name ("Year 2019",
+"January 2019"), so lookups can use integer equality instead of parsing
+display names. idx_sessions_period backs the existence probe in
+affected_sessions.py.
+
+This migration is SAFE to run multiple times.
+
+Usage:
+    python migrate_add_session_period_columns.py
+"""
+
+import sqlite3
+import calendar
+
+DB_PATH = 'data/yearly_monthly.db'
+
+MONTH_NUMBERS = {name: number for number, name in enumerate(calendar.month_name) if name}
+
+
+def parse_period(session_type, session_name):
+    """Return (period_year, period_month) for a session name, or (None, None)."""
+    parts = session_name.split()
+    if len(parts) != 2 or not parts[1].isdigit():
+        return None, None
+
+    if session_type == 'Yearly' and parts[0] == 'Year':
+        return int(parts[1]), None
+    if session_type == 'Monthly' and parts[0] in MONTH_NUMBERS:
+        return int(parts[1]), MONTH_NUMBERS[parts[0]]
+    return None, None
+
+
+def migrate():
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    print("=" * 80)
+    print("MIGRATION: Add period_year/period_month to sessions table")
+    print("=" * 80)
+    print()
+
+    cursor.execute("PRAGMA table_info(sessions)")
+    columns = {col[1] for col in cursor.fetchall()}
+
+    for column in ('period_year', 'period_month'):
+        if column in columns:
+            print(f"[SKIP] {column} column already exists")
+        else:
+            cursor.execute(f"ALTER TABLE sessions ADD COLUMN {column} INTEGER")
+            print(f"[OK] {column} column added")
+
+    # Backfill rows that don't have a period yet
+    cursor.execute("""
+        SELECT id, session_type, session_name
+        FROM sessions
+        WHERE period_year IS NULL
+    """)
+    updates = []
+    unparsed = 0
+    for session_id, session_type, session_name in cursor.fetchall():
+        period_year, period_month = parse_period(session_type, session_name)
+        if period_year is None:
+            unparsed += 1
+            continue
+        updates.append((period_year, period_month, session_id))
+
+    cursor.executemany("""
+        UPDATE sessions
+        SET period_year = ?, period_month = ?
+        WHERE id = ?
+    """, updates)
+    print(f"[OK] Backfilled {len(updates)} sessions")
+    if unparsed:
+        print(f"[WARN] {unparsed} sessions have unrecognized names and were left NULL")
+
+    print("Creating idx_sessions_period...")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sessions_period
+        ON sessions(symbol, session_type, period_year, period_month)
+    """)
+    print("[OK] idx_sessions_period ready")
+
+    conn.commit()
+
+    print()
+    print("=" * 80)
+    print("[SUCCESS] Migration complete!")
+    print("=" * 80)
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Add a (nearest_poi_event_id, swing_time) index to the swings table in ohlc_data.db.
+
+- idx_swings_poi_time: backs the swings-near-a-POI-event lookups (the
+  swings JOIN poi_events queries in check_december_swings.py) with an index
+  search per POI event instead of a full swings scan, already ordered by
+  swing_time within each event
+- idx_swings_poi_link (nearest_poi_event_id) is dropped if present: it is a
+  prefix of idx_swings_poi_time
+
+ANALYZE is run afterwards so the query planner has statistics to choose it.
+
+This migration is SAFE to run multiple times (checks indexes first).
+
+Usage:
+    python migrate_add_swing_poi_index.py
+"""
+
+import sqlite3
+
+DB_PATH = 'data/ohlc_data.db'
+
+
+def migrate():
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    print("=" * 80)
+    print("MIGRATION: Add idx_swings_poi_time to swings table")
+    print("=" * 80)
+    print()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='swings'")
+    indexes = {row[0] for row in cursor.fetchall()}
+
+    if 'idx_swings_poi_time' in indexes:
+        print("[SKIP] idx_swings_poi_time already exists")
+    else:
+        print("Creating idx_swings_poi_time...")
+        cursor.execute("CREATE INDEX idx_swings_poi_time ON swings(nearest_poi_event_id, swing_time)")
+        print("[OK] idx_swings_poi_time created")
+
+    if 'idx_swings_poi_link' in indexes:
+        print("Dropping idx_swings_poi_link (prefix of idx_swings_poi_time)...")
+        cursor.execute("DROP INDEX idx_swings_poi_link")
+        print("[OK] idx_swings_poi_link dropped")
+    else:
+        print("[SKIP] idx_swings_poi_link not present")
+
+    print()
+    print("Running ANALYZE swings...")
+    cursor.execute("ANALYZE swings")
+    print("[OK] Planner statistics updated")
+
+    conn.commit()
+
+    print()
+    print("=" * 80)
+    print("[SUCCESS] Migration complete!")
+    print("=" * 80)
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Combined read-only status report for the 1M database.
+
+Runs the check_*.py reports on one open_ro() connection inside a single read
+transaction, instead of each script opening, warming and closing the
+database on its own. Every report sees the same snapshot, even when a
+writer commits partway through.
+
+Each check script still runs standalone (python check_weekly_sessions.py);
+this script only imports their report() functions.
+
+Usage:
+    python status.py                    # every report
+    python status.py --ohlc --sessions  # selected reports, in the order below
+"""
+
+import argparse
+
+import check_data
+import check_database_status
+import check_december_poi_events
+import check_december_sessions
+import check_december_swings
+import check_monthly_sessions
+import check_weekly_sessions
+from db_utils import open_ro
+
+DB_PATH = 'data/ohlc_data.db'
+
+# (flag, help, report functions) in output order
+REPORTS = [
+    ('ohlc', '1M candle range per symbol (check_data.py)',
+     [check_data.report]),
+    ('db-status', 'database status and diagnosis (check_database_status.py)',
+     [check_database_status.report]),
+    ('sessions', 'Weekly and Monthly sessions (check_weekly_sessions.py, check_monthly_sessions.py)',
+     [check_weekly_sessions.report, check_monthly_sessions.report]),
+    ('december', 'December 2025 sessions, POI events and swings (check_december_*.py)',
+     [check_december_sessions.report, check_december_poi_events.report, check_december_swings.report]),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run the check_*.py reports on one read-only connection'
+    )
+    for flag, help_text, _ in REPORTS:
+        parser.add_argument(f'--{flag}', action='store_true', help=help_text)
+    parser.add_argument('--db', default=DB_PATH,
+                        help=f'Database path (default: {DB_PATH})')
+
+    args = parser.parse_args()
+
+    selected = [
+        reports for flag, _, reports in REPORTS
+        if getattr(args, flag.replace('-', '_'))
+    ]
+    # Default to every report if none specified
+    if not selected:
+        selected = [reports for _, _, reports in REPORTS]
+
+    conn = open_ro(args.db)
+    ok = True
+    try:
+        # One read transaction: the shared lock and snapshot are taken once
+        # and held across every report's queries
+        conn.execute("BEGIN")
+
+        for reports in selected:
+            for report in reports:
+                ok = report(conn) and ok
+                print()
+
+        conn.rollback()
+    finally:
+        conn.close()
+
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()